@@ -2,105 +2,184 @@
 """Extract conversation from Claude Code JSONL log, excluding thinking blocks."""
 
 import json
+import re
 import sys
 
-def extract_conversation(input_file, output_file):
-    """Extract user and assistant messages, excluding thinking and tool results."""
-    messages = []
-
-    with open(input_file, 'r') as f:
-        for line_num, line in enumerate(f, 1):
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj):
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+    def _dumps_line(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def _iter_lines(f, chunk_size=1 << 20):
+    """Yield raw lines from a binary file, reading it in large chunks."""
+    buf = b''
+    while chunk := f.read(chunk_size):
+        buf += chunk
+        *lines, buf = buf.split(b'\n')
+        yield from lines
+    if buf:
+        yield buf
+
+def _handle_user(obj, line_num, append):
+    """Extract user message (skip tool results)."""
+    message = obj.get('message', {})
+    content = message.get('content', '')
+
+    # Skip if this is a tool result (not actual user text)
+    if isinstance(content, list) and content:
+        if content[0].get('type') == 'tool_result':
+            return
+        # Extract text from text blocks
+        text_parts = [
+            item.get('text', '')
+            for item in content
+            if type(item) is dict and item.get('type') == 'text'
+        ]
+        text = ' '.join(text_parts)
+    elif isinstance(content, str):
+        text = content
+    else:
+        return
+
+    # Only add if we have actual text
+    if text.strip():
+        append({
+            'role': 'user',
+            'text': text,
+            'line': line_num
+        })
+
+def _handle_queue_operation(obj, line_num, append):
+    """Extract user messages queued while Claude was working."""
+    operation = obj.get('operation')
+    if operation == 'enqueue':
+        text = obj.get('content', '')
+        if text.strip():
+            append({
+                'role': 'user',
+                'text': text,
+                'line': line_num,
+                'queued': True
+            })
+
+def _handle_assistant(obj, line_num, append):
+    """Extract assistant message, filtering out thinking."""
+    message = obj.get('message', {})
+    content = message.get('content', [])
+    texts = []
+    tool_names = []
+
+    for item in content:
+        if type(item) is dict:
+            item_type = item.get('type')
+            if item_type == 'text':
+                texts.append(item.get('text', ''))
+            elif item_type == 'tool_use':
+                # Just capture tool name, not full input/output
+                tool_names.append(item.get('name'))
+            # Skip 'thinking' type
+
+    # Only add if we have text or tools
+    if texts or tool_names:
+        msg = {
+            'role': 'assistant',
+            'text': '\n\n'.join(texts) if texts else '',
+            'line': line_num
+        }
+        if tool_names:
+            msg['tools'] = tool_names
+        append(msg)
+
+def _handle_system(obj, line_num, append):
+    """Include system messages for context."""
+    text = obj.get('text', '')
+    if text.strip():
+        append({
+            'role': 'system',
+            'text': text,
+            'line': line_num
+        })
+
+# Entry type -> handler; other entry types (e.g. file-history-snapshot) are skipped
+_HANDLERS = {
+    'user': _handle_user,
+    'queue-operation': _handle_queue_operation,
+    'assistant': _handle_assistant,
+    'system': _handle_system,
+}
+
+# Long assistant lines are usually pure thinking blocks; a byte scan for the
+# block types we keep lets those be dropped without a full JSON parse
+_PREFILTER_MIN_LEN = 32 * 1024
+_ASSISTANT_MARKER = b'"type":"assistant"'
+_KEPT_BLOCK_RE = re.compile(rb'"type":"(?:text|tool_use)"')
+
+def _is_discardable(line):
+    """Return True for a long assistant line holding no text or tool_use block."""
+    return (len(line) > _PREFILTER_MIN_LEN
+            and _ASSISTANT_MARKER in line
+            and _KEPT_BLOCK_RE.search(line) is None)
+
+def iter_conversation(input_file):
+    """Yield user and assistant messages one at a time, excluding thinking and tool results."""
+    pending = []
+    append = pending.append
+    get_handler = _HANDLERS.get
+
+    # _iter_lines already reads in 1 MiB chunks, so skip the BufferedReader layer
+    with open(input_file, 'rb', buffering=0) as f:
+        for line_num, line in enumerate(_iter_lines(f), 1):
+            if _is_discardable(line):
+                continue
             try:
-                obj = json.loads(line)
-                msg_type = obj.get('type')
-
-                if msg_type == 'user':
-                    # Extract user message (skip tool results)
-                    message = obj.get('message', {})
-                    content = message.get('content', '')
-
-                    # Skip if this is a tool result (not actual user text)
-                    if isinstance(content, list) and content:
-                        if content[0].get('type') == 'tool_result':
-                            continue
-                        # Extract text from text blocks
-                        text_parts = [
-                            item.get('text', '')
-                            for item in content
-                            if isinstance(item, dict) and item.get('type') == 'text'
-                        ]
-                        text = ' '.join(text_parts)
-                    elif isinstance(content, str):
-                        text = content
-                    else:
-                        continue
-
-                    # Only add if we have actual text
-                    if text.strip():
-                        messages.append({
-                            'role': 'user',
-                            'text': text,
-                            'line': line_num
-                        })
-
-                elif msg_type == 'queue-operation':
-                    # These are user messages queued while Claude was working
-                    operation = obj.get('operation')
-                    if operation == 'enqueue':
-                        text = obj.get('content', '')
-                        if text.strip():
-                            messages.append({
-                                'role': 'user',
-                                'text': text,
-                                'line': line_num,
-                                'queued': True
-                            })
-
-                elif msg_type == 'assistant':
-                    # Extract assistant message, filtering out thinking
-                    message = obj.get('message', {})
-                    content = message.get('content', [])
-                    texts = []
-                    tool_names = []
-
-                    for item in content:
-                        if isinstance(item, dict):
-                            if item.get('type') == 'text':
-                                texts.append(item.get('text', ''))
-                            elif item.get('type') == 'tool_use':
-                                # Just capture tool name, not full input/output
-                                tool_names.append(item.get('name'))
-                            # Skip 'thinking' type
-
-                    # Only add if we have text or tools
-                    if texts or tool_names:
-                        msg = {
-                            'role': 'assistant',
-                            'text': '\n\n'.join(texts) if texts else '',
-                            'line': line_num
-                        }
-                        if tool_names:
-                            msg['tools'] = tool_names
-                        messages.append(msg)
-
-                elif msg_type == 'system':
-                    # Include system messages for context
-                    text = obj.get('text', '')
-                    if text.strip():
-                        messages.append({
-                            'role': 'system',
-                            'text': text,
-                            'line': line_num
-                        })
+                obj = _loads(line)
+                handler = get_handler(obj.get('type'))
+                if handler is not None:
+                    handler(obj, line_num, append)
 
             except json.JSONDecodeError:
                 print(f"Warning: Could not parse line {line_num}", file=sys.stderr)
             except Exception as e:
                 print(f"Warning: Error on line {line_num}: {e}", file=sys.stderr)
 
-    # Write to output
-    with open(output_file, 'w') as f:
-        json.dump(messages, f, indent=2)
+            # Handlers add at most one message per line
+            if pending:
+                yield pending.pop()
+
+def extract_conversation(input_file, output_file):
+    """Extract user and assistant messages, excluding thinking and tool results.
+
+    A ``.jsonl`` output file is streamed one message per line as messages are
+    produced; any other name gets a single indented JSON array. Either way
+    the list of messages is returned; use iter_conversation to stream
+    without keeping them.
+    """
+    if output_file.endswith('.jsonl'):
+        messages = []
+        append = messages.append
+        with open(output_file, 'wb') as f:
+            write = f.write
+            for msg in iter_conversation(input_file):
+                write(_dumps_line(msg))
+                append(msg)
+    else:
+        messages = list(iter_conversation(input_file))
+        with open(output_file, 'wb') as f:
+            f.write(_dumps(messages))
 
     print(f"Extracted {len(messages)} messages to {output_file}")
     return messages
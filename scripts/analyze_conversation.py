@@ -3,60 +3,65 @@
 
 import json
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=4)
+def load_conversation(json_path: str):
+    """Load the extracted conversation JSON (cached per path for the run)."""
+    # Read raw bytes in one large-buffered read; json decodes UTF-8 bytes itself
+    with open(json_path, 'rb', buffering=1 << 20) as f:
+        return json.loads(f.read())
+
+
 def analyze_conversation(json_path: str):
     """Extract statistics from the conversation JSON."""
-    with open(json_path, 'r') as f:
-        conversation = json.load(f)
-
-    # Count messages by role
-    user_messages = 0
-    assistant_messages = 0
-    tool_calls_by_type = Counter()
-    total_tool_calls = 0
-
-    for entry in conversation:
-        role = entry.get('role')
-
-        if role == 'user':
-            user_messages += 1
-        elif role == 'assistant':
-            assistant_messages += 1
-
-            # Count tool calls
-            tools = entry.get('tools', [])
-            for tool in tools:
-                tool_calls_by_type[tool] += 1
-                total_tool_calls += 1
-
-    # Print statistics
+    conversation = load_conversation(json_path)
+
+    # Count messages by role in one C-level pass over the role column
+    roles = [entry.get('role') for entry in conversation]
+    role_counts = Counter(roles)
+    user_messages = role_counts['user']
+    assistant_messages = role_counts['assistant']
+
+    # Gather every tool call, then count them in one bulk Counter update
+    all_tools = []
+    for entry, role in zip(conversation, roles):
+        if role == 'assistant':
+            all_tools.extend(entry.get('tools', ()))
+    tool_calls_by_type = Counter(all_tools)
+    total_tool_calls = len(all_tools)
+
+    return {
+        'total_entries': len(conversation),
+        'user_messages': user_messages,
+        'assistant_messages': assistant_messages,
+        'total_tool_calls': total_tool_calls,
+        'tool_calls_by_type': tool_calls_by_type
+    }
+
+
+def print_stats(stats):
+    """Print formatted conversation statistics."""
     print("=" * 70)
     print("CONVERSATION STATISTICS")
     print("=" * 70)
     print()
-    print(f"Total conversation entries: {len(conversation)}")
-    print(f"User messages: {user_messages}")
-    print(f"Assistant messages: {assistant_messages}")
+    print(f"Total conversation entries: {stats['total_entries']}")
+    print(f"User messages: {stats['user_messages']}")
+    print(f"Assistant messages: {stats['assistant_messages']}")
     print()
-    print(f"Total tool calls: {total_tool_calls}")
+    print(f"Total tool calls: {stats['total_tool_calls']}")
     print()
     print("Tool calls by type:")
     print("-" * 70)
-    for tool, count in sorted(tool_calls_by_type.items(), key=lambda x: x[1], reverse=True):
+    for tool, count in stats['tool_calls_by_type'].most_common():
         print(f"  {tool:30s}: {count:4d}")
     print()
 
-    return {
-        'total_entries': len(conversation),
-        'user_messages': user_messages,
-        'assistant_messages': assistant_messages,
-        'total_tool_calls': total_tool_calls,
-        'tool_calls_by_type': dict(tool_calls_by_type)
-    }
-
 
 if __name__ == '__main__':
-    json_path = Path(__file__).parent / 'claude-conversation' / 'conversation_extracted.json'
-    analyze_conversation(str(json_path))
+    json_path = Path(__file__).parent.parent / 'claude-conversation' / 'conversation_extracted.json'
+    stats = analyze_conversation(str(json_path))
+    print_stats(stats)
@@ -1,23 +1,99 @@
 #!/usr/bin/env python3
 """Analyze the project structure and codebase statistics."""
 
+import json
 import os
-from pathlib import Path
-from collections import defaultdict
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+
+# Binary formats whose "lines" are meaningless; they are counted as files only
+BINARY_EXTS = {
+    '.png', '.jpg', '.jpeg', '.gif', '.ico', '.webp', '.pdf', '.zip', '.gz',
+    '.tar', '.whl', '.so', '.pyd', '.dll', '.exe', '.bin', '.db', '.sqlite',
+}
 
 
 def count_lines(file_path):
     """Count lines in a file."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return len(f.readlines())
+        lines = 0
+        last = b''
+        with open(file_path, 'rb', buffering=0) as f:
+            while chunk := f.read(1 << 20):
+                lines += chunk.count(b'\n')
+                last = chunk
+        # A final line without a trailing newline still counts
+        if last and not last.endswith(b'\n'):
+            lines += 1
+        return lines
     except Exception:
         return 0
 
 
-def analyze_project(root_dir='.'):
-    """Analyze project structure and statistics."""
-    root = Path(root_dir)
+def count_entry_lines(entry):
+    """Count lines in a scanned file, skipping binary formats without opening them."""
+    if os.path.splitext(entry.name)[1].lower() in BINARY_EXTS:
+        return 0
+    return count_lines(entry.path)
+
+
+def iter_files(path, rel_dir, exclude_dirs):
+    """Yield (relative dir, DirEntry) for every countable file under path."""
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # Like os.walk, list symlinked directories but don't descend into them
+                if (entry.name not in exclude_dirs and not entry.name.endswith('.egg-info')
+                        and not entry.is_symlink()):
+                    subdirs.append(entry)
+            # Skip hidden files and compiled files
+            elif not (entry.name.startswith('.') or entry.name.endswith('.pyc')):
+                yield rel_dir, entry
+
+    for entry in subdirs:
+        sub_rel = entry.name if rel_dir == '.' else os.path.join(rel_dir, entry.name)
+        yield from iter_files(entry.path, sub_rel, exclude_dirs)
+
+
+CACHE_FILE = '.stats_cache.json'
+
+
+def _tree_key(files):
+    """Fingerprint the walked files so a cached result can be reused safely."""
+    max_mtime = max((entry.stat().st_mtime_ns for _, entry in files), default=0)
+    paths = '\0'.join(entry.path for _, entry in files)
+    return [len(files), max_mtime, zlib.crc32(paths.encode())]
+
+
+# Per-type and per-directory tallies; JSON round-trips them as plain dicts
+_COUNTER_FIELDS = ('files_by_type', 'lines_by_type', 'files_by_dir', 'lines_by_dir')
+
+
+def _load_cached(cache_path, exclude_key, tree_key):
+    """Return cached stats for this exclude set if the tree hasn't changed."""
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}, None
+    entry = cache.get(exclude_key)
+    if entry and entry.get('key') == tree_key:
+        stats = dict(entry['stats'])
+        for name in _COUNTER_FIELDS:
+            stats[name] = Counter(stats[name])
+        return cache, stats
+    return cache, None
+
+
+def analyze_project(root_dir='.', exclude=(), use_cache=True):
+    """Analyze project structure and statistics.
+
+    Results are cached in ``.stats_cache.json`` under root_dir, keyed by the
+    extra excludes and a fingerprint of the tree (file count, newest mtime
+    and file paths), so repeat runs skip re-reading every file.
+    """
 
     # Directories to exclude
     exclude_dirs = {
@@ -25,6 +101,7 @@ def analyze_project(root_dir='.'):
         'node_modules', '.tox', 'build', 'dist', '*.egg-info',
         '.devcontainer', 'treasure_hunt'  # Exclude generated treasure hunts
     }
+    exclude_dirs.update(exclude)
 
     # Track statistics
     stats = {
@@ -36,37 +113,39 @@ def analyze_project(root_dir='.'):
         'python_lines': 0,
         'test_lines': 0,
         'source_lines': 0,
-        'files_by_type': defaultdict(int),
-        'lines_by_type': defaultdict(int),
-        'files_by_dir': defaultdict(int),
-        'lines_by_dir': defaultdict(int),
+        'files_by_type': Counter(),
+        'lines_by_type': Counter(),
+        'files_by_dir': Counter(),
+        'lines_by_dir': Counter(),
     }
 
-    # Walk the directory tree
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Filter out excluded directories
-        dirnames[:] = [d for d in dirnames if d not in exclude_dirs and not d.endswith('.egg-info')]
+    # Walk the directory tree, collecting files to count
+    files = list(iter_files(root_dir, '.', exclude_dirs))
 
-        rel_dir = Path(dirpath).relative_to(root)
+    if use_cache:
+        cache_path = os.path.join(root_dir, CACHE_FILE)
+        exclude_key = ','.join(sorted(exclude))
+        tree_key = _tree_key(files)
+        cache, cached = _load_cached(cache_path, exclude_key, tree_key)
+        if cached is not None:
+            return cached
 
-        for filename in filenames:
-            # Skip hidden files and compiled files
-            if filename.startswith('.') or filename.endswith('.pyc'):
-                continue
+    # Count lines concurrently; reads release the GIL
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        line_counts = executor.map(count_entry_lines, [entry for _, entry in files])
 
-            file_path = Path(dirpath) / filename
-            extension = file_path.suffix
+        for (rel_dir, entry), lines in zip(files, line_counts):
+            extension = os.path.splitext(entry.name)[1]
 
             # Count file
             stats['total_files'] += 1
             stats['files_by_type'][extension if extension else 'no_extension'] += 1
-            stats['files_by_dir'][str(rel_dir)] += 1
+            stats['files_by_dir'][rel_dir] += 1
 
             # Count lines
-            lines = count_lines(file_path)
             stats['total_lines'] += lines
             stats['lines_by_type'][extension if extension else 'no_extension'] += lines
-            stats['lines_by_dir'][str(rel_dir)] += lines
+            stats['lines_by_dir'][rel_dir] += lines
 
             # Python-specific stats
             if extension == '.py':
@@ -74,13 +153,21 @@ def analyze_project(root_dir='.'):
                 stats['python_lines'] += lines
 
                 # Check if it's a test file
-                if 'test' in str(file_path).lower() or filename.startswith('test_'):
+                if 'test' in entry.path.lower() or entry.name.startswith('test_'):
                     stats['test_files'] += 1
                     stats['test_lines'] += lines
                 else:
                     stats['source_files'] += 1
                     stats['source_lines'] += lines
 
+    if use_cache:
+        cache[exclude_key] = {'key': tree_key, 'stats': stats}
+        try:
+            with open(cache_path, 'w') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+
     return stats
 
 
@@ -107,14 +194,14 @@ def print_stats(stats):
 
     print("Files by Type:")
     print("-" * 70)
-    for ext, count in sorted(stats['files_by_type'].items(), key=lambda x: x[1], reverse=True):
+    for ext, count in stats['files_by_type'].most_common():
         lines = stats['lines_by_type'][ext]
         print(f"  {ext:20s}: {count:4} files, {lines:6,} lines")
     print()
 
     print("Files by Directory (top 10):")
     print("-" * 70)
-    for dir_path, count in sorted(stats['files_by_dir'].items(), key=lambda x: x[1], reverse=True)[:10]:
+    for dir_path, count in stats['files_by_dir'].most_common(10):
         lines = stats['lines_by_dir'][dir_path]
         # Truncate long paths
         display_path = dir_path if len(dir_path) <= 35 else '...' + dir_path[-32:]
@@ -2,70 +2,96 @@
 """Extract and analyze timestamps from the JSONL conversation file."""
 
 import json
-import subprocess
+import os
 from datetime import datetime
+from functools import lru_cache
 
 
-def extract_timestamps():
-    """Extract start and end timestamps from JSONL file."""
-    # Get first line
-    first_line = subprocess.run(
-        ['head', '-n', '1', 'claude-conversation/2025-11-07.jsonl'],
-        capture_output=True,
-        text=True
-    ).stdout.strip()
+def read_first_and_last_lines(path, block_size=1 << 16):
+    """Read the first and last lines of a file without scanning all of it."""
+    with open(path, 'rb') as f:
+        first_line = f.readline()
 
-    # Get last line
-    last_line = subprocess.run(
-        ['tail', '-n', '1', 'claude-conversation/2025-11-07.jsonl'],
-        capture_output=True,
-        text=True
-    ).stdout.strip()
+        # Read backwards from the end until the block holds a full last line
+        size = f.seek(0, os.SEEK_END)
+        back = min(size, block_size)
+        while True:
+            f.seek(size - back)
+            tail = f.read(back).rstrip(b'\n')
+            if b'\n' in tail or back == size:
+                break
+            back = min(size, back * 2)
 
-    # Parse JSON
-    first_entry = json.loads(first_line)
-    last_entry = json.loads(last_line)
+    last_line = tail.rsplit(b'\n', 1)[-1]
+    return first_line.strip(), last_line.strip()
 
-    # Extract timestamps
-    start_time_str = first_entry.get('timestamp') or first_entry.get('snapshot', {}).get('timestamp')
-    end_time_str = last_entry.get('timestamp')
+
+_TIMESTAMP_KEY = b'"timestamp":"'
+
+
+def grab_timestamp(line):
+    """Pull the timestamp out of a raw JSONL line, parsing JSON only as a fallback."""
+    # A byte scan is only unambiguous with exactly one match; message
+    # content (e.g. tool inputs) can hold nested "timestamp" keys
+    if line.count(_TIMESTAMP_KEY) != 1:
+        entry = json.loads(line)
+        return entry.get('timestamp') or entry.get('snapshot', {}).get('timestamp')
+    start = line.find(_TIMESTAMP_KEY) + len(_TIMESTAMP_KEY)
+    return line[start:line.find(b'"', start)].decode()
+
+
+@lru_cache(maxsize=4)
+def extract_timestamps(jsonl_path='claude-conversation/2025-11-07.jsonl'):
+    """Extract start and end timestamps from JSONL file (cached per path for the run)."""
+    # Get first and last lines
+    first_line, last_line = read_first_and_last_lines(jsonl_path)
+
+    # Extract timestamps (the only fields needed, so skip a full JSON parse)
+    start_time_str = grab_timestamp(first_line)
+    end_time_str = grab_timestamp(last_line)
 
     # Parse timestamps
-    start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-    end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
+    start_time = datetime.fromisoformat(start_time_str)
+    end_time = datetime.fromisoformat(end_time_str)
 
     # Calculate duration
     duration = end_time - start_time
+    total_seconds = int(duration.total_seconds())
 
-    # Print results
+    return {
+        'start_time': start_time_str,
+        'end_time': end_time_str,
+        'start_display': start_time.strftime('%Y-%m-%d %H:%M:%S %Z'),
+        'end_display': end_time.strftime('%Y-%m-%d %H:%M:%S %Z'),
+        'duration_seconds': total_seconds,
+        'duration_hours': total_seconds // 3600,
+        'duration_minutes': (total_seconds % 3600) // 60,
+        'duration_str': str(duration)
+    }
+
+
+def print_timeline(timeline):
+    """Print formatted session timeline."""
     print("=" * 70)
     print("SESSION TIMELINE")
     print("=" * 70)
     print()
-    print(f"Start time: {start_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-    print(f"End time:   {end_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+    print(f"Start time: {timeline['start_display']}")
+    print(f"End time:   {timeline['end_display']}")
     print()
-    print(f"Total duration: {duration}")
+    print(f"Total duration: {timeline['duration_str']}")
     print()
 
     # Break down duration
-    total_seconds = int(duration.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
+    total_seconds = timeline['duration_seconds']
     seconds = total_seconds % 60
 
     print(f"Duration breakdown:")
-    print(f"  {hours} hours, {minutes} minutes, {seconds} seconds")
+    print(f"  {timeline['duration_hours']} hours, {timeline['duration_minutes']} minutes, {seconds} seconds")
     print(f"  ({total_seconds:,} total seconds)")
     print()
 
-    return {
-        'start_time': start_time_str,
-        'end_time': end_time_str,
-        'duration_seconds': total_seconds,
-        'duration_str': str(duration)
-    }
-
 
 if __name__ == '__main__':
-    extract_timestamps()
+    timeline = extract_timestamps()
+    print_timeline(timeline)
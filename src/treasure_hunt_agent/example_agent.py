@@ -7,7 +7,21 @@ and follows the clues to find the treasure.
 
 import argparse
 import json
-from pathlib import Path
+import os
+
+
+def _read_small_file(path: str, max_bytes: int = 4096) -> str:
+    """Read a short clue or treasure file with raw os-level calls.
+
+    Clue files are tens of bytes, so the buffered text-file stack
+    (BufferedReader, TextIOWrapper, codec lookup) costs more than the read.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, max_bytes)
+    finally:
+        os.close(fd)
+    return data.strip().decode()
 
 
 def navigate_treasure_hunt(hunt_path: str) -> dict[str, str | int]:
@@ -27,10 +41,11 @@ def navigate_treasure_hunt(hunt_path: str) -> dict[str, str | int]:
     dict
         Results including steps taken and treasure key found
     """
-    base = Path(hunt_path).resolve()
+    base = os.path.realpath(hunt_path)
+    base_prefix = os.path.join(base, '')
 
     # Read config (cheating!)
-    config_path = base / '.treasure_hunt_config.json'
+    config_path = os.path.join(base, '.treasure_hunt_config.json')
     with open(config_path, 'r') as f:
         config = json.load(f)
 
@@ -38,29 +53,31 @@ def navigate_treasure_hunt(hunt_path: str) -> dict[str, str | int]:
     print(f"Start file: {config['start_file']}")
     print()
 
-    # Navigate the hunt
-    current_file = base / config['start_file']
-    treasure_filename = Path(config['treasure_file']).name
+    # Navigate the hunt using plain string paths (the hunt has no symlinks,
+    # so lexical normalization is equivalent to resolve())
+    current_file = os.path.join(base, config['start_file'])
+    treasure_filename = os.path.basename(config['treasure_file'])
     steps = 0
     visited = []
 
-    while current_file.name != treasure_filename and steps < 100:
-        print(f"Step {steps + 1}: Reading {current_file.relative_to(base)}")
-        visited.append(str(current_file.relative_to(base)))
+    while os.path.basename(current_file) != treasure_filename and steps < 100:
+        display_path = current_file.removeprefix(base_prefix)
+        print(f"Step {steps + 1}: Reading {display_path}")
+        visited.append(display_path)
 
-        clue = current_file.read_text().strip()
+        clue = _read_small_file(current_file)
         print(f"  Clue: {clue}")
 
         # Navigate to next file
-        next_file = (current_file.parent / clue).resolve()
-        current_file = next_file
+        current_file = os.path.normpath(os.path.join(os.path.dirname(current_file), clue))
         steps += 1
 
     # Read treasure
-    treasure_key = current_file.read_text().strip()
-    visited.append(str(current_file.relative_to(base)))
+    treasure_key = _read_small_file(current_file)
+    display_path = current_file.removeprefix(base_prefix)
+    visited.append(display_path)
 
-    print(f"\nFound treasure at: {current_file.relative_to(base)}")
+    print(f"\nFound treasure at: {display_path}")
     print(f"Treasure key: {treasure_key}")
     print(f"Total steps: {steps}")
     print(f"\nPath taken:")
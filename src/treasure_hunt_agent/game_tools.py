@@ -13,16 +13,50 @@ Example:
     'Changed directory to: subdir'
 """
 
+import heapq
 import os
+import stat
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+# Formatted ls output: (path, limit) -> (st_mtime_ns, listing)
+_LS_CACHE_SIZE = 256
+_ls_cache: dict[tuple[str, int | None], tuple[int, str]] = {}
+
+# File contents for cat, least recently used first: path -> (st_mtime_ns, st_size, text)
+_CAT_CACHE_SIZE = 128
+_cat_cache: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+
+
+def _rel(root: str, path: str) -> str | None:
+    """
+    Return path relative to root by prefix subtraction.
+
+    Parameters
+    ----------
+    root : str
+        Normalized hunt root
+    path : str
+        Normalized absolute path
+
+    Returns
+    -------
+    str | None
+        Relative path ("." for the root itself), or None if path is outside root
+    """
+    if path == root:
+        return "."
+    if path.startswith(root) and path[len(root):len(root) + 1] == os.sep:
+        return path[len(root) + 1:]
+    return None
+
 
 def _validate_path(
-    state: Any, path: str, must_exist: bool = True, must_be_file: bool = False
-) -> Path | str:
+    state: Any, path: str, *, must_be_file: bool = False, must_be_dir: bool = False
+) -> tuple[str | None, os.stat_result | None, str | None]:
     """
-    Validate that a path stays within treasure_hunt_root.
+    Validate that a path exists and stays within treasure_hunt_root.
 
     Parameters
     ----------
@@ -30,51 +64,60 @@ def _validate_path(
         Current game state with treasure_hunt_root and current_dir
     path : str
         Path to validate (relative or absolute)
-    must_exist : bool
-        If True, path must exist
     must_be_file : bool
         If True, path must be a file (not directory)
+    must_be_dir : bool
+        If True, path must be a directory
 
     Returns
     -------
-    Path | str
-        Resolved path if valid, error message string if invalid
+    tuple[str | None, os.stat_result | None, str | None]
+        (resolved path, its stat result, None) if valid,
+        (None, None, error message) if invalid
 
     Examples
     --------
     >>> state = GameState(...)
-    >>> result = _validate_path(state, "subdir/file.txt")
-    >>> isinstance(result, Path)
+    >>> resolved, st, error = _validate_path(state, "subdir/file.txt")
+    >>> error is None
     True
     """
     # Reject absolute paths
     if os.path.isabs(path):
-        return "Error: Absolute paths are not allowed"
+        return None, None, "Error: Absolute paths are not allowed"
 
-    # Resolve path relative to current directory
+    # Normalize lexically relative to current directory. Generated hunts
+    # hold no symlinks, so this matches resolve() without touching the
+    # filesystem; symlinks are not followed, so one placed under the hunt
+    # root could lead outside it.
     try:
-        resolved = (state.current_dir / path).resolve()
+        candidate = os.path.normpath(os.path.join(state.current_dir, path))
     except Exception as e:
-        return f"Error: Invalid path: {e}"
+        return None, None, f"Error: Invalid path: {e}"
 
-    # Check if path escapes hunt root
-    try:
-        resolved.relative_to(state.treasure_hunt_root)
-    except ValueError:
-        return "Error: Path is outside treasure hunt boundary"
+    # Check if path escapes hunt root (".." escapes are caught lexically)
+    if _rel(os.fspath(state.treasure_hunt_root), candidate) is None:
+        return None, None, "Error: Path is outside treasure hunt boundary"
 
-    # Check existence
-    if must_exist and not resolved.exists():
-        return f"Error: Path does not exist: {path}"
+    # One stat answers existence and file type, and callers reuse it
+    try:
+        st = os.stat(candidate)
+    except (OSError, ValueError):
+        return None, None, f"Error: Path does not exist: {path}"
 
-    # Check if file when required
-    if must_be_file and resolved.exists() and not resolved.is_file():
-        return f"Error: Path is a directory, not a file: {path}"
+    # Check type when required; only regular files may be read, since
+    # opening e.g. a FIFO would block
+    if must_be_file and not stat.S_ISREG(st.st_mode):
+        if stat.S_ISDIR(st.st_mode):
+            return None, None, f"Error: Path is a directory, not a file: {path}"
+        return None, None, f"Error: Not a regular file: {path}"
+    if must_be_dir and not stat.S_ISDIR(st.st_mode):
+        return None, None, f"Error: Not a directory: {path}"
 
-    return resolved
+    return candidate, st, None
 
 
-def ls(state: Any, path: str = ".") -> str:
+def ls(state: Any, path: str = ".", limit: int | None = None) -> str:
     """
     List files and directories at path.
 
@@ -84,6 +127,8 @@ def ls(state: Any, path: str = ".") -> str:
         Current game state
     path : str
         Path to list (relative to current_dir), defaults to "."
+    limit : int | None
+        If given, list only the first `limit` entries in sorted order
 
     Returns
     -------
@@ -95,26 +140,56 @@ def ls(state: Any, path: str = ".") -> str:
     >>> ls(state, ".")
     'file1.txt\\nfile2.txt\\nsubdir/\\n'
     """
-    resolved = _validate_path(state, path, must_exist=True)
+    if limit is not None:
+        # Arguments decoded from the model's JSON may arrive as floats
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            return "Error: limit must be a positive integer"
+        if limit < 1:
+            return "Error: limit must be a positive integer"
 
-    if isinstance(resolved, str):
-        return resolved
+    key, st, error = _validate_path(state, path, must_be_dir=True)
 
-    if not resolved.is_dir():
-        return f"Error: Not a directory: {path}"
+    if error is not None:
+        return error
 
     try:
-        items = []
-        for item in sorted(resolved.iterdir()):
-            name = item.name
-            if item.is_dir():
-                name += "/"
-            items.append(name)
-
-        if not items:
-            return "(empty directory)"
-
-        return "\\n".join(items)
+        # The hunt tree is fixed during a game, so a listing stays valid
+        # for as long as the directory's mtime is unchanged
+        mtime_ns = st.st_mtime_ns
+        cached = _ls_cache.get((key, limit))
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        # scandir answers is_dir() from the d_type returned with each entry,
+        # so listing needs no per-entry stat call
+        with os.scandir(key) as it:
+            names = []
+            dirs = set()
+            for e in it:
+                names.append(e.name)
+                if e.is_dir():
+                    dirs.add(e.name)
+
+        if not names:
+            listing = "(empty directory)"
+        else:
+            total = len(names)
+            if limit is not None and limit < total:
+                # Partial sort: only the first `limit` names are ordered
+                names = heapq.nsmallest(limit, names)
+            else:
+                names.sort()
+            listing = "\\n".join(name + "/" if name in dirs else name for name in names)
+            if len(names) < total:
+                listing += f"\\n... ({total - len(names)} more entries)"
+
+        # Bounded FIFO: dicts keep insertion order, so the first key is oldest
+        if len(_ls_cache) >= _LS_CACHE_SIZE:
+            del _ls_cache[next(iter(_ls_cache))]
+        _ls_cache[(key, limit)] = (mtime_ns, listing)
+        return listing
     except PermissionError:
         return f"Error: Permission denied: {path}"
     except Exception as e:
@@ -142,25 +217,21 @@ def cd(state: Any, path: str) -> str:
     >>> cd(state, "subdir")
     'Changed directory to: subdir'
     """
-    resolved = _validate_path(state, path, must_exist=True)
+    resolved, _, error = _validate_path(state, path, must_be_dir=True)
 
-    if isinstance(resolved, str):
-        return resolved
+    if error is not None:
+        return error
 
-    if not resolved.is_dir():
-        return f"Error: Not a directory: {path}"
-
-    # Update state
-    state.current_dir = resolved
+    # Update state (current_dir stays a Path for callers)
+    state.current_dir = Path(resolved)
 
     # Return relative path for confirmation
-    try:
-        rel_path = resolved.relative_to(state.treasure_hunt_root)
-        if str(rel_path) == ".":
-            return "Changed directory to: / (hunt root)"
-        return f"Changed directory to: {rel_path}"
-    except ValueError:
+    rel_path = _rel(os.fspath(state.treasure_hunt_root), resolved)
+    if rel_path is None:
         return "Changed directory"
+    if rel_path == ".":
+        return "Changed directory to: / (hunt root)"
+    return f"Changed directory to: {rel_path}"
 
 
 def cat(state: Any, file_path: str) -> str:
@@ -184,13 +255,26 @@ def cat(state: Any, file_path: str) -> str:
     >>> cat(state, "start.txt")
     'Welcome to the treasure hunt!'
     """
-    resolved = _validate_path(state, file_path, must_exist=True, must_be_file=True)
+    key, st, error = _validate_path(state, file_path, must_be_file=True)
 
-    if isinstance(resolved, str):
-        return resolved
+    if error is not None:
+        return error
 
     try:
-        return resolved.read_text()
+        # Clue files are re-read often but never change mid-game; trust the
+        # cached text while the file's mtime and size are unchanged
+        cached = _cat_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _cat_cache.move_to_end(key)
+            return cached[2]
+
+        with open(key) as f:
+            text = f.read()
+        _cat_cache[key] = (st.st_mtime_ns, st.st_size, text)
+        _cat_cache.move_to_end(key)
+        if len(_cat_cache) > _CAT_CACHE_SIZE:
+            _cat_cache.popitem(last=False)
+        return text
     except UnicodeDecodeError:
         return f"Error: File is not a text file: {file_path}"
     except PermissionError:
@@ -218,13 +302,12 @@ def pwd(state: Any) -> str:
     >>> pwd(state)
     'subdir/nested'
     """
-    try:
-        rel_path = state.current_dir.relative_to(state.treasure_hunt_root)
-        if str(rel_path) == ".":
-            return "/"
-        return str(rel_path)
-    except ValueError:
+    rel_path = _rel(os.fspath(state.treasure_hunt_root), os.fspath(state.current_dir))
+    if rel_path is None:
         return "Error: Current directory is outside hunt root"
+    if rel_path == ".":
+        return "/"
+    return rel_path
 
 
 def check_treasure(state: Any, key: str) -> dict[str, bool | str]:
@@ -316,6 +399,18 @@ def ask_human(state: Any, question: str) -> str:
     return f"[Human input needed] Question: {question}"
 
 
+# Tool name -> implementation, for dispatching agent tool calls
+TOOL_FUNCS = {
+    "ls": ls,
+    "cd": cd,
+    "cat": cat,
+    "pwd": pwd,
+    "check_treasure": check_treasure,
+    "give_up": give_up,
+    "ask_human": ask_human,
+}
+
+
 # Tool definitions for Gemini API
 TOOL_DEFINITIONS = [
     {
@@ -327,6 +422,10 @@ TOOL_DEFINITIONS = [
                 "path": {
                     "type": "string",
                     "description": "Path to list (relative to current directory). Defaults to current directory."
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of entries to list (in sorted order). Lists everything if omitted."
                 }
             }
         }
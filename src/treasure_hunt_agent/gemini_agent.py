@@ -12,11 +12,39 @@ Example:
     Hello! How can I help you?
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Any
-import uuid
+from typing import TYPE_CHECKING, Any
+import itertools
+
+from treasure_hunt_agent.game_tools import TOOL_DEFINITIONS
+
+if TYPE_CHECKING:
+    from google.generativeai.types import Tool
+
+
+def _genai() -> Any:
+    """
+    Import google.generativeai on first use.
+
+    Importing this module (e.g. just for ToolResult) doesn't pull in the
+    SDK; functions that need it call this, or import its types locally.
+    """
+    import google.generativeai as genai
+
+    return genai
 
-import google.generativeai as genai
+
+def __getattr__(name: str) -> Any:
+    """Resolve GEMINI_TOOLS, which is built on first access."""
+    if name == "GEMINI_TOOLS":
+        return _get_gemini_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Tool call IDs only need to be unique within a process, so a counter will do
+_tool_call_ids = itertools.count()
 
 
 @dataclass
@@ -36,7 +64,7 @@ class ToolCall:
 
     name: str
     arguments: dict
-    id: str = field(default_factory=lambda: f"call_{uuid.uuid4().hex[:8]}")
+    id: str = field(default_factory=lambda: f"call_{next(_tool_call_ids):08x}")
 
 
 @dataclass
@@ -82,6 +110,46 @@ class AgentResponse:
     usage: dict
 
 
+def _build_gemini_tools(tools: list[dict]) -> list[Any]:
+    """
+    Build Gemini Tool objects from tool definition dicts.
+
+    Parameters
+    ----------
+    tools : list[dict]
+        Tool definitions with name, description and parameters
+
+    Returns
+    -------
+    list[Tool]
+        A single Tool wrapping one FunctionDeclaration per definition
+    """
+    from google.generativeai.types import FunctionDeclaration, Tool
+
+    function_declarations = [
+        FunctionDeclaration(
+            name=tool["name"],
+            description=tool.get("description", ""),
+            parameters=tool.get("parameters", {}),
+        )
+        for tool in tools
+    ]
+    return [Tool(function_declarations=function_declarations)]
+
+
+# The game's tool set in Gemini format, built on first use; reset to None
+# to rebuild it (e.g. after patching the SDK in tests)
+_gemini_tools: list[Any] | None = None
+
+
+def _get_gemini_tools() -> list[Any]:
+    """The game's tool set in Gemini format (GEMINI_TOOLS), built once on first use."""
+    global _gemini_tools
+    if _gemini_tools is None:
+        _gemini_tools = _build_gemini_tools(TOOL_DEFINITIONS)
+    return _gemini_tools
+
+
 class GeminiAgent:
     """
     Agent that uses Gemini models via google-generativeai SDK.
@@ -95,8 +163,8 @@ class GeminiAgent:
         Name of the Gemini model to use (e.g., "gemini-1.5-flash")
     system_instructions : str
         System instructions/prompt for the agent
-    tools : list[dict]
-        List of tool definitions in Gemini format
+    tools : list[dict] | list[Tool]
+        List of tool definitions, or prebuilt Gemini tools such as GEMINI_TOOLS
 
     Examples
     --------
@@ -113,7 +181,7 @@ class GeminiAgent:
         self,
         model_name: str,
         system_instructions: str,
-        tools: list[dict],
+        tools: list[dict] | list[Tool],
         temperature: float = 1.0,
         api_key: str | None = None,
     ):
@@ -126,8 +194,8 @@ class GeminiAgent:
             Gemini model name
         system_instructions : str
             System instructions for the agent
-        tools : list[dict]
-            Tool definitions
+        tools : list[dict] | list[Tool]
+            Tool definitions, or prebuilt Gemini tools such as GEMINI_TOOLS
         temperature : float
             Sampling temperature (0.0 to 2.0)
         api_key : str | None
@@ -138,6 +206,8 @@ class GeminiAgent:
         self.tools = tools
         self.temperature = temperature
 
+        genai = _genai()
+
         # Configure API
         if api_key:
             genai.configure(api_key=api_key)
@@ -156,23 +226,15 @@ class GeminiAgent:
         self.chat = None
         self._reset_chat()
 
-    def _convert_tools_to_gemini_format(self, tools: list[dict]) -> list[Any]:
+    def _convert_tools_to_gemini_format(self, tools: list[Any]) -> list[Any]:
         """Convert tool definitions to Gemini's expected format."""
-        # Gemini expects tools in a specific format
-        # For now, we'll pass them as-is and let the SDK handle it
-        # The SDK expects a list of function declarations
-        from google.generativeai.types import FunctionDeclaration, Tool
-
-        function_declarations = []
-        for tool in tools:
-            func_decl = FunctionDeclaration(
-                name=tool["name"],
-                description=tool.get("description", ""),
-                parameters=tool.get("parameters", {}),
-            )
-            function_declarations.append(func_decl)
-
-        return [Tool(function_declarations=function_declarations)]
+        # The game's own tool set is converted once and reused
+        if tools is TOOL_DEFINITIONS:
+            return _get_gemini_tools()
+        # Already-built Tool objects (e.g. GEMINI_TOOLS) pass straight through
+        if not isinstance(tools[0], dict):
+            return tools
+        return _build_gemini_tools(tools)
 
     def _reset_chat(self):
         """Reset the chat session."""
@@ -240,19 +302,17 @@ class GeminiAgent:
         Any
             Message in Gemini's expected format for tool results
         """
-        from google.generativeai.protos import Content, Part, FunctionResponse
+        from google.generativeai.protos import Content, FunctionResponse, Part
 
-        # Create function response parts
-        parts = []
-        for result in tool_results:
+        # Build one function response part per result, filling a presized list
+        parts: list[Any] = [None] * len(tool_results)
+        for i, result in enumerate(tool_results):
             # Convert result to dict if it's a string
             result_dict = result.result if isinstance(result.result, dict) else {"output": result.result}
 
-            func_response = FunctionResponse(
-                name=result.name,
-                response=result_dict,
+            parts[i] = Part(
+                function_response=FunctionResponse(name=result.name, response=result_dict)
             )
-            parts.append(Part(function_response=func_response))
 
         # Return the content with function responses
         return Content(parts=parts, role="user")
@@ -271,43 +331,37 @@ class GeminiAgent:
         AgentResponse
             Parsed response with text, tool calls, and metadata
         """
-        # Extract text (if any)
-        # Note: response.text will raise an error if the response only contains function calls
+        # Extract text, tool calls and finish reason from the first candidate,
+        # in one pass over its parts. Reading response.text instead would
+        # raise ValueError on tool-call-only turns.
         text = None
-        try:
-            if hasattr(response, "text"):
-                text = response.text
-        except ValueError:
-            # Response contains only function calls, no text
-            text = None
-
-        # Extract tool calls (if any)
         tool_calls = None
-        if response.candidates and len(response.candidates) > 0:
-            candidate = response.candidates[0]
-            parts = candidate.content.parts
+        finish_reason = "STOP"
+        candidates = response.candidates
+        if candidates:
+            candidate = candidates[0]
 
-            # Check for function calls
+            text_chunks = []
             function_calls = []
-            for part in parts:
-                if hasattr(part, "function_call") and part.function_call:
-                    fc = part.function_call
+            for part in candidate.content.parts:
+                part_text = getattr(part, "text", None)
+                if part_text:
+                    text_chunks.append(part_text)
+                    continue
+                fc = getattr(part, "function_call", None)
+                if fc is not None and fc.name:
                     tool_call = ToolCall(
                         name=fc.name,
-                        arguments=dict(fc.args) if fc.args else {},
+                        arguments={k: v for k, v in fc.args.items()} if fc.args else {},
                     )
                     function_calls.append(tool_call)
 
+            text = "".join(text_chunks) or None
             if function_calls:
                 tool_calls = function_calls
 
-        # Extract finish reason
-        finish_reason = "STOP"
-        if response.candidates and len(response.candidates) > 0:
-            finish_reason = str(response.candidates[0].finish_reason)
-            # Remove enum prefix if present
-            if "." in finish_reason:
-                finish_reason = finish_reason.split(".")[-1]
+            # Remove enum prefix if present (e.g. "FinishReason.STOP")
+            finish_reason = str(candidate.finish_reason).rpartition(".")[2]
 
         # Extract usage metadata
         usage = {
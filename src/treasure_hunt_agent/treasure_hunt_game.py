@@ -13,22 +13,18 @@ Example:
     Success: True, Turns: 12
 """
 
-import json
+import os
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from treasure_hunt_agent.game_tools import (
-    ls,
-    cd,
-    cat,
-    pwd,
-    check_treasure,
-    give_up,
-    ask_human,
-    TOOL_DEFINITIONS,
-)
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    from json import loads as _loads
+
+from treasure_hunt_agent.game_tools import TOOL_FUNCS
 
 
 # Import ToolResult from gemini_agent if available, otherwise define it
@@ -169,14 +165,18 @@ class TreasureHuntGame:
         max_tokens: int = 100000,
     ):
         """Initialize the game."""
-        self.hunt_path = Path(hunt_path)
+        # Absolute (but not symlink-resolved) so the tools' lexical boundary
+        # checks work for relative hunt paths too
+        self.hunt_path = Path(os.path.abspath(hunt_path))
         self.agent = agent
         self.tool_calls_log: list[dict] = []
+        # Key from the first check_treasure call, recorded as tools run
+        self._first_check_treasure_key: str | None = None
 
         # Load hunt configuration
         config_path = self.hunt_path / ".treasure_hunt_config.json"
-        with open(config_path, "r") as f:
-            config = json.load(f)
+        with open(config_path, "rb") as f:
+            config = _loads(f.read())
 
         # Initialize game state
         self.state = GameState(
@@ -188,16 +188,8 @@ class TreasureHuntGame:
             start_file=config["start_file"],
         )
 
-        # Tool function mapping
-        self.tools = {
-            "ls": ls,
-            "cd": cd,
-            "cat": cat,
-            "pwd": pwd,
-            "check_treasure": check_treasure,
-            "give_up": give_up,
-            "ask_human": ask_human,
-        }
+        # Tool function mapping (a copy, so per-game overrides stay local)
+        self.tools = dict(TOOL_FUNCS)
 
     def get_state(self) -> GameState:
         """Get current game state."""
@@ -224,10 +216,18 @@ class TreasureHuntGame:
         """
         start_time = time.time()
 
+        # Bind the state, limits and methods the loop uses every turn
+        state = self.state
+        max_turns = state.max_turns
+        max_tokens = state.max_tokens
+        agent_step = self.agent.step
+        execute_tools = self._execute_tools
+        end_game = self._end_game
+
         # Send initial message to agent
         initial_message = (
             f"You are at the root of a treasure hunt. "
-            f"The starting file is '{self.state.start_file}'. "
+            f"The starting file is '{state.start_file}'. "
             f"Use your tools to navigate the filesystem and find the treasure key. "
             f"When you think you have the key, use check_treasure to verify it."
         )
@@ -236,17 +236,17 @@ class TreasureHuntGame:
 
         # Main game loop
         while (
-            not self.state.game_over
-            and self.state.turn_number < self.state.max_turns
-            and self.state.tokens_used < self.state.max_tokens
+            not state.game_over
+            and state.turn_number < max_turns
+            and state.tokens_used < max_tokens
         ):
-            self.state.turn_number += 1
+            state.turn_number += 1
 
             # Agent step
             try:
-                response = self.agent.step(game_input)
+                response = agent_step(game_input)
             except Exception as e:
-                return self._end_game(
+                return end_game(
                     success=False,
                     end_reason="error",
                     error=f"Agent error: {e}",
@@ -254,15 +254,14 @@ class TreasureHuntGame:
                 )
 
             # Track token usage
-            self.state.tokens_used += response.usage.get("total_tokens", 0)
-            self.state.prompt_tokens_used += response.usage.get("prompt_tokens", 0)
-            self.state.completion_tokens_used += response.usage.get(
-                "completion_tokens", 0
-            )
+            usage = response.usage
+            state.tokens_used += usage.get("total_tokens", 0)
+            state.prompt_tokens_used += usage.get("prompt_tokens", 0)
+            state.completion_tokens_used += usage.get("completion_tokens", 0)
 
             # Check token limit
-            if self.state.tokens_used >= self.state.max_tokens:
-                return self._end_game(
+            if state.tokens_used >= max_tokens:
+                return end_game(
                     success=False,
                     end_reason="max_tokens",
                     error=None,
@@ -271,14 +270,14 @@ class TreasureHuntGame:
 
             # Execute tool calls if any
             if response.tool_calls:
-                tool_results = self._execute_tools(response.tool_calls)
+                tool_results = execute_tools(response.tool_calls)
 
                 # Check if game ended during tool execution
-                if self.state.game_over:
-                    return self._end_game(
-                        success=self.state.success or False,
+                if state.game_over:
+                    return end_game(
+                        success=state.success or False,
                         end_reason="treasure_found"
-                        if self.state.success
+                        if state.success
                         else "gave_up",
                         error=None,
                         start_time=start_time,
@@ -292,14 +291,14 @@ class TreasureHuntGame:
                 game_input = "No tools were called. Please use your tools to explore."
 
         # Loop ended without finding treasure
-        if self.state.turn_number >= self.state.max_turns:
+        if state.turn_number >= max_turns:
             end_reason = "max_turns"
-        elif self.state.tokens_used >= self.state.max_tokens:
+        elif state.tokens_used >= max_tokens:
             end_reason = "max_tokens"
         else:
             end_reason = "unknown"
 
-        return self._end_game(
+        return end_game(
             success=False, end_reason=end_reason, error=None, start_time=start_time
         )
 
@@ -325,12 +324,9 @@ class TreasureHuntGame:
             if not tool_func:
                 result = f"Error: Unknown tool: {tool_call.name}"
             else:
-                # Execute tool
+                # Execute tool; missing or unexpected arguments raise a
+                # TypeError that is reported back to the agent
                 try:
-                    # Handle optional path parameter for ls
-                    if tool_call.name == "ls" and "path" not in tool_call.arguments:
-                        tool_call.arguments["path"] = "."
-
                     result = tool_func(self.state, **tool_call.arguments)
                 except Exception as e:
                     result = f"Error executing {tool_call.name}: {e}"
@@ -345,6 +341,9 @@ class TreasureHuntGame:
                 }
             )
 
+            if tool_call.name == "check_treasure" and self._first_check_treasure_key is None:
+                self._first_check_treasure_key = tool_call.arguments.get("key")
+
             # Create tool result
             tool_result = ToolResult(
                 tool_call_id=tool_call.id,
@@ -385,17 +384,10 @@ class TreasureHuntGame:
         """
         total_time = time.time() - start_time
 
-        # Try to find treasure key if checked
-        treasure_key_found = None
-        for log in self.tool_calls_log:
-            if log["name"] == "check_treasure":
-                treasure_key_found = log["arguments"].get("key")
-                break
-
         return GameResult(
             success=success,
             turns_taken=self.state.turn_number,
-            treasure_key_found=treasure_key_found,
+            treasure_key_found=self._first_check_treasure_key,
             total_tokens=self.state.tokens_used,
             prompt_tokens=self.state.prompt_tokens_used,
             completion_tokens=self.state.completion_tokens_used,
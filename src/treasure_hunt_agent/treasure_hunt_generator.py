@@ -18,33 +18,92 @@ Example:
 
 import json
 import os
+import pickle
 import random
 import secrets
 import string
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Filtered word lists are cached here, keyed by the source file's mtime and size
+_WORD_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'treasure_hunt_agent',
+    'words.pkl',
+)
+
+
+def _read_word_file(path: str) -> list[str]:
+    """Read and filter a system word list."""
+    with open(path, 'r') as f:
+        words = [
+            line.strip().lower()
+            for line in f
+            if line.strip() and line.strip().isalpha() and len(line.strip()) >= 3
+        ]
+    # Filter to reasonable length words
+    return [w for w in words if 3 <= len(w) <= 12]
+
+
+def _load_cached_words(cache_path: str, key: tuple) -> list[str] | None:
+    """Return the cached word list if it was built from the same source file."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, words = pickle.load(f)
+    except Exception:
+        # Missing, truncated or unreadable cache - rebuild it
+        return None
+    return words if cached_key == key else None
+
+
+def _save_cached_words(cache_path: str, key: tuple, words: list[str]) -> None:
+    """Write the word list cache atomically; failures are not fatal."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, words), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
 
 # Load word list for generating random names
-def _load_word_list() -> list[str]:
-    """Load a list of words for generating random file/directory names."""
-    # Try common word list locations
-    word_list_paths = [
-        '/usr/share/dict/words',
-        '/usr/dict/words',
-    ]
+def _load_word_list(
+    word_list_paths: tuple[str, ...] = ('/usr/share/dict/words', '/usr/dict/words'),
+    cache_path: str = _WORD_CACHE_PATH,
+) -> list[str]:
+    """
+    Load a list of words for generating random file/directory names.
 
+    The filtered list is pickled to `cache_path` so later imports skip
+    re-parsing the system word list while it is unchanged.
+    """
+    # Try common word list locations
     for path in word_list_paths:
-        if os.path.exists(path):
-            with open(path, 'r') as f:
-                words = [
-                    line.strip().lower()
-                    for line in f
-                    if line.strip() and line.strip().isalpha() and len(line.strip()) >= 3
-                ]
-                # Filter to reasonable length words
-                words = [w for w in words if 3 <= len(w) <= 12]
-                return words
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+
+        key = (path, st.st_mtime_ns, st.st_size)
+        words = _load_cached_words(cache_path, key)
+        if words is None:
+            words = _read_word_file(path)
+            _save_cached_words(cache_path, key, words)
+        return words
 
     # Fallback: generate a basic word list
     return [
@@ -57,8 +116,10 @@ def _load_word_list() -> list[str]:
     ]
 
 
-# Global word list (loaded once)
-_WORD_LIST = _load_word_list()
+@lru_cache(maxsize=1)
+def _get_word_list() -> list[str]:
+    """Return the word list, loading it on first use rather than at import."""
+    return _load_word_list()
 
 
 # Difficulty presets
@@ -170,24 +231,38 @@ def generate_treasure_hunt(
     path_length = random.randint(max(2, max_path_dirs - 1), max_path_dirs)
     golden_path = _generate_golden_path(path_length)
 
-    # Build the tree structure
-    _build_tree(
-        base=base,
-        golden_path=golden_path,
-        current_depth=0,
-        max_depth=depth,
-        branching_factor=branching_factor,
-        file_density=file_density,
-    )
+    # Tally of entries created, kept while building instead of re-walking the tree
+    counts = {'dirs': 0, 'files': 0}
+
+    # Build the tree structure. Red herring subtrees are independent of each
+    # other and of the golden path, so their mkdir/write syscalls run on a
+    # thread pool while the golden path is built.
+    futures: list[Future] = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        _build_tree(
+            base=os.fspath(base),
+            golden_path=golden_path,
+            current_depth=0,
+            max_depth=depth,
+            branching_factor=branching_factor,
+            file_density=file_density,
+            counts=counts,
+            executor=executor,
+            futures=futures,
+        )
+        for future in futures:
+            subtree_counts = future.result()
+            counts['dirs'] += subtree_counts['dirs']
+            counts['files'] += subtree_counts['files']
 
     # Write clue files along the golden path
     treasure_file_rel = _write_clue_files(
-        base, golden_path, treasure_key, start_filename, treasure_filename
+        os.fspath(base), golden_path, treasure_key, start_filename, treasure_filename, counts
     )
 
     # Count statistics
-    num_directories = sum(1 for _ in base.rglob("*") if _.is_dir())
-    num_files = sum(1 for _ in base.rglob("*") if _.is_file())
+    num_directories = counts['dirs']
+    num_files = counts['files']
 
     # Calculate actual path length (number of hops from start to treasure)
     # With N directories: start → clue1 → clue2 → ... → clueN → treasure
@@ -209,8 +284,8 @@ def generate_treasure_hunt(
     }
 
     config_path = base / '.treasure_hunt_config.json'
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    with open(config_path, 'wb') as f:
+        f.write(_dumps(config))
 
     return {
         'treasure_key': treasure_key,
@@ -223,6 +298,10 @@ def generate_treasure_hunt(
     }
 
 
+# Characters a treasure key is drawn from
+_KEY_ALPHABET = string.ascii_letters + string.digits
+
+
 def _generate_key(length: int = 16, use_seed: bool = True) -> str:
     """
     Generate a random treasure key.
@@ -234,11 +313,8 @@ def _generate_key(length: int = 16, use_seed: bool = True) -> str:
     use_seed : bool
         If True, uses random (respects seed). If False, uses secrets (cryptographically secure).
     """
-    alphabet = string.ascii_letters + string.digits
-    if use_seed:
-        return ''.join(random.choice(alphabet) for _ in range(length))
-    else:
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+    choice = random.choice if use_seed else secrets.choice
+    return ''.join([choice(_KEY_ALPHABET) for _ in range(length)])
 
 
 def _generate_golden_path(length: int) -> list[list[str]]:
@@ -266,166 +342,267 @@ def _generate_golden_path(length: int) -> list[list[str]]:
     return path
 
 
-def _random_dirname() -> str:
+def _random_dirname(rng: Any = random) -> str:
     """Generate a random directory name from word list."""
-    return random.choice(_WORD_LIST)
+    return rng.choice(_get_word_list())
 
 
-def _random_filename() -> str:
+def _random_filename(rng: Any = random) -> str:
     """Generate a random filename from word list."""
-    word = random.choice(_WORD_LIST)
+    word = rng.choice(_get_word_list())
     return f"{word}.txt"
 
 
+def _pick_red_herrings(correct_dir: str, k: int) -> list[str]:
+    """
+    Pick `k` distinct directory names, none equal to `correct_dir`.
+
+    Draws `k + 1` words in one `random.sample` call so that dropping the
+    correct name still leaves enough, falling back to drawing one name at
+    a time only when the word list runs short of distinct words.
+    """
+    words = _get_word_list()
+    picks = random.sample(words, k + 1) if k + 1 <= len(words) else []
+    # dict.fromkeys drops repeated words while keeping the draw order
+    red_herrings = list(dict.fromkeys(w for w in picks if w != correct_dir))[:k]
+
+    seen = set(red_herrings)
+    while len(red_herrings) < k:
+        name = _random_dirname()
+        if name != correct_dir and name not in seen:
+            seen.add(name)
+            red_herrings.append(name)
+    return red_herrings
+
+
+def _make_dir(path: str, counts: dict[str, int]) -> None:
+    """Create a directory if missing, counting it only when newly created."""
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        return
+    counts['dirs'] += 1
+
+
+def _write_file(path: str, data: bytes, counts: dict[str, int]) -> None:
+    """Write a small file with raw os calls, counting it only when newly created."""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except FileExistsError:
+        # Random names can repeat; overwrite as before without recounting
+        fd = os.open(path, os.O_WRONLY | os.O_TRUNC)
+    else:
+        counts['files'] += 1
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_files(writes: list[tuple[str, bytes]], counts: dict[str, int]) -> None:
+    """Write pre-encoded files in order."""
+    for path, data in writes:
+        _write_file(path, data, counts)
+
+
 def _build_tree(
-    base: Path,
+    base: str,
     golden_path: list[list[str]],
     current_depth: int,
     max_depth: int,
     branching_factor: int,
     file_density: float,
+    counts: dict[str, int],
+    executor: ThreadPoolExecutor,
+    futures: list[Future],
     path_index: int = 0,
 ) -> None:
     """
-    Recursively build the directory tree.
+    Build the directory tree along the golden path.
+
+    Walks the golden path with an explicit stack of levels rather than
+    recursing, visiting directories (and drawing random numbers) in the
+    same depth-first order a recursive walk would.
 
     Parameters
     ----------
-    base : Path
-        Current directory being built
+    base : str
+        Directory to start building in
     golden_path : list[list[str]]
         The golden path structure
     current_depth : int
-        Current depth in the tree
+        Depth of `base` in the tree
     max_depth : int
         Maximum allowed depth
     branching_factor : int
         Average number of child directories
     file_density : float
         Probability of creating clue files
+    counts : dict[str, int]
+        Running 'dirs' and 'files' totals, updated in place
+    executor : ThreadPoolExecutor
+        Pool that red herring subtrees are built on
+    futures : list[Future]
+        Collects one future per submitted subtree; each returns its own counts
     path_index : int
-        Current index in the golden path
+        Index in the golden path of the level under `base`
     """
-    if current_depth >= max_depth:
-        return
+    # Each entry is one golden path level still being created:
+    # (directory, its depth, level index, correct child name, child name iterator)
+    stack: list[tuple[str, int, int, str, Any]] = []
 
-    # Determine if we're on the golden path
-    on_golden_path = path_index < len(golden_path)
+    def enter_level(level_base: str, depth: int, index: int) -> None:
+        # Stop past the maximum depth or the end of the golden path
+        if depth >= max_depth or index >= len(golden_path):
+            return
 
-    if on_golden_path:
         # Add red herrings to this level of the golden path
-        correct_dir = golden_path[path_index][0]
+        correct_dir = golden_path[index][0]
         num_red_herrings = random.randint(branching_factor - 1, branching_factor + 1)
 
         # Generate unique red herring names
-        red_herrings = set()
-        while len(red_herrings) < num_red_herrings:
-            name = _random_dirname()
-            if name != correct_dir:
-                red_herrings.add(name)
-
-        golden_path[path_index].extend(red_herrings)
-
-        # Create all directories at this level
-        for dirname in golden_path[path_index]:
-            dir_path = base / dirname
-            dir_path.mkdir(exist_ok=True)
-
-            if dirname == correct_dir:
-                # Continue golden path
-                _build_tree(
-                    base=dir_path,
-                    golden_path=golden_path,
-                    current_depth=current_depth + 1,
-                    max_depth=max_depth,
-                    branching_factor=branching_factor,
-                    file_density=file_density,
-                    path_index=path_index + 1,
-                )
-            else:
-                # Red herring: maybe add some depth
-                if random.random() < 0.5 and current_depth + 1 < max_depth:
-                    _build_red_herring_subtree(
-                        dir_path,
-                        current_depth + 1,
-                        max_depth,
-                        branching_factor,
-                        file_density,
-                    )
-
-            # Maybe add a clue file (for red herrings)
-            # But only if it won't exceed max depth
-            if dirname != correct_dir and random.random() < file_density:
-                if current_depth + 1 < max_depth:  # current_depth+1 is dir level, +1 more for file
-                    _write_red_herring_clue(dir_path)
+        red_herrings = _pick_red_herrings(correct_dir, num_red_herrings)
+
+        golden_path[index].extend(red_herrings)
+        stack.append((level_base, depth, index, correct_dir, iter(golden_path[index])))
+
+    enter_level(base, current_depth, path_index)
+
+    # Create all directories level by level
+    while stack:
+        level_base, depth, index, correct_dir, dirnames = stack[-1]
+        dirname = next(dirnames, None)
+        if dirname is None:
+            stack.pop()
+            continue
+
+        dir_path = os.path.join(level_base, dirname)
+        _make_dir(dir_path, counts)
+
+        if dirname == correct_dir:
+            # Continue golden path; its level is finished before our siblings
+            enter_level(dir_path, depth + 1, index + 1)
+            continue
+
+        # Red herring: maybe add some depth. The subtree gets its own
+        # generator, seeded from the main stream, so the result stays
+        # reproducible however the threads are scheduled.
+        if random.random() < 0.5 and depth + 1 < max_depth:
+            futures.append(executor.submit(
+                _build_red_herring_task,
+                dir_path,
+                depth + 1,
+                max_depth,
+                branching_factor,
+                file_density,
+                random.getrandbits(64),
+            ))
+
+        # Maybe add a clue file (for red herrings)
+        # But only if it won't exceed max depth
+        if random.random() < file_density:
+            if depth + 1 < max_depth:  # depth+1 is dir level, +1 more for file
+                _write_red_herring_clue(dir_path, counts)
+
+
+def _build_red_herring_task(
+    base: str,
+    current_depth: int,
+    max_depth: int,
+    branching_factor: int,
+    file_density: float,
+    seed: int,
+) -> dict[str, int]:
+    """Build one red herring subtree on a worker thread and return its counts."""
+    counts = {'dirs': 0, 'files': 0}
+    _build_red_herring_subtree(
+        base,
+        current_depth,
+        max_depth,
+        branching_factor,
+        file_density,
+        counts,
+        random.Random(seed),
+    )
+    return counts
 
 
 def _build_red_herring_subtree(
-    base: Path,
+    base: str,
     current_depth: int,
     max_depth: int,
     branching_factor: int,
     file_density: float,
+    counts: dict[str, int],
+    rng: random.Random,
 ) -> None:
-    """Build a red herring subtree (dead end)."""
-    if current_depth >= max_depth or random.random() < 0.3:
-        return
-
-    # Create a few random subdirectories
-    num_children = random.randint(0, branching_factor)
-    for _ in range(num_children):
-        dirname = _random_dirname()
-        dir_path = base / dirname
-        dir_path.mkdir(exist_ok=True)
+    """Build a red herring subtree (dead end), depth-first without recursion."""
+    # Each entry is a directory still getting children: [path, depth, children left]
+    stack: list[list[Any]] = []
+
+    def maybe_expand(directory: str, depth: int) -> None:
+        if depth >= max_depth or rng.random() < 0.3:
+            return
+        # Create a few random subdirectories
+        stack.append([directory, depth, rng.randint(0, branching_factor)])
+
+    maybe_expand(base, current_depth)
+
+    while stack:
+        frame = stack[-1]
+        directory, depth, remaining = frame
+        if not remaining:
+            stack.pop()
+            continue
+        frame[2] = remaining - 1
+
+        dirname = _random_dirname(rng)
+        dir_path = os.path.join(directory, dirname)
+        _make_dir(dir_path, counts)
 
         # Maybe add a misleading clue (but don't exceed max depth)
-        if random.random() < file_density and current_depth + 1 < max_depth:
-            _write_red_herring_clue(dir_path)
+        if rng.random() < file_density and depth + 1 < max_depth:
+            _write_red_herring_clue(dir_path, counts, rng)
 
-        # Maybe recurse
-        if random.random() < 0.4:
-            _build_red_herring_subtree(
-                dir_path,
-                current_depth + 1,
-                max_depth,
-                branching_factor,
-                file_density,
-            )
+        # Maybe descend; the new directory's children come before our siblings
+        if rng.random() < 0.4:
+            maybe_expand(dir_path, depth + 1)
 
 
-def _write_red_herring_clue(directory: Path) -> None:
+def _write_red_herring_clue(directory: str, counts: dict[str, int], rng: Any = random) -> None:
     """Write a misleading or dead-end clue file."""
-    clue_filename = _random_filename()
-    clue_file = directory / clue_filename
+    clue_filename = _random_filename(rng)
+    clue_file = os.path.join(directory, clue_filename)
 
     # Different types of red herrings
-    choice = random.randint(0, 2)
+    choice = rng.randint(0, 2)
     if choice == 0:
         # Point to a non-existent file
-        fake_path = f"../{_random_dirname()}/{_random_filename()}"
+        fake_path = f"../{_random_dirname(rng)}/{_random_filename(rng)}"
     elif choice == 1:
         # Vague or unhelpful message
         fake_path = "# Dead end - try another path"
     else:
         # Point to another red herring
-        fake_path = f"./{_random_dirname()}/{_random_filename()}"
+        fake_path = f"./{_random_dirname(rng)}/{_random_filename(rng)}"
 
-    clue_file.write_text(fake_path)
+    _write_file(clue_file, fake_path.encode(), counts)
 
 
 def _write_clue_files(
-    base: Path,
+    base: str,
     golden_path: list[list[str]],
     treasure_key: str,
     start_filename: str,
     treasure_filename: str,
+    counts: dict[str, int],
 ) -> str:
     """
     Write clue files along the golden path.
 
     Parameters
     ----------
-    base : Path
+    base : str
         Base directory of the hunt
     golden_path : list[list[str]]
         The golden path structure
@@ -435,17 +612,23 @@ def _write_clue_files(
         Name of the starting file
     treasure_filename : str
         Name of the treasure file
+    counts : dict[str, int]
+        Running 'dirs' and 'files' totals, updated in place
 
     Returns
     -------
     str
         Relative path to treasure file from base
     """
-    # Write start file
+    # Collect (path, encoded contents) for every file first, then write them
+    # in one pass. Later writes to a repeated name overwrite earlier ones.
     if len(golden_path) == 0:
         # Edge case: treasure at root
-        (base / start_filename).write_text(f"./{treasure_filename}")
-        (base / treasure_filename).write_text(treasure_key)
+        writes = [
+            (os.path.join(base, start_filename), f"./{treasure_filename}".encode()),
+            (os.path.join(base, treasure_filename), treasure_key.encode()),
+        ]
+        _write_files(writes, counts)
         return treasure_filename
 
     # Build the actual path
@@ -457,22 +640,23 @@ def _write_clue_files(
 
     # start file points to first clue
     first_clue_path = path_dirs[0] + "/" + clue_filenames[0]
-    (base / start_filename).write_text(first_clue_path)
+    writes = [(os.path.join(base, start_filename), first_clue_path.encode())]
 
-    # Write clues along the path
+    # Clues along the path
+    last = len(path_dirs) - 1
     for i, dirname in enumerate(path_dirs):
-        current = current / dirname
+        current = os.path.join(current, dirname)
 
-        if i < len(path_dirs) - 1:
+        if i < last:
             # Intermediate clue - next dir is a subdirectory of current
-            next_dir = path_dirs[i + 1]
-            next_clue = clue_filenames[i + 1]
-            relative_path = f"{next_dir}/{next_clue}"
-            (current / clue_filenames[i]).write_text(relative_path)
+            relative_path = f"{path_dirs[i + 1]}/{clue_filenames[i + 1]}"
+            writes.append((os.path.join(current, clue_filenames[i]), relative_path.encode()))
         else:
             # Last clue points to treasure
-            (current / clue_filenames[i]).write_text(f"{treasure_filename}")
-            (current / treasure_filename).write_text(treasure_key)
+            writes.append((os.path.join(current, clue_filenames[i]), treasure_filename.encode()))
+            writes.append((os.path.join(current, treasure_filename), treasure_key.encode()))
+
+    _write_files(writes, counts)
 
     # Return relative path to treasure
     treasure_path = "/".join(path_dirs) + "/" + treasure_filename
@@ -0,0 +1,244 @@
+"""
+Shared fixtures for the test suite.
+
+- Game tools: a read-only hunt tree shared by the session (temp_hunt,
+  paths, game_state) and a per-test one for tests that modify it
+  (mutable_hunt, mutable_state)
+- Game: generated hunts cached across runs, for tests that consume a
+  hunt rather than test the generator (hunt_cache)
+- Gemini agent: sample tool definitions and mocks for google.generativeai
+  (sample_tools, mock_genai)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass, replace
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+
+@dataclass
+class GameState:
+    """Minimal GameState for testing."""
+    treasure_hunt_root: Path
+    current_dir: Path
+    treasure_key: str
+    game_over: bool = False
+    success: bool | None = None
+
+
+@dataclass(frozen=True)
+class HuntPaths:
+    """Directories of the test hunt."""
+    root: Path
+    subdir: Path
+    nested: Path
+
+
+def _build_hunt(hunt_root):
+    """Create the test hunt structure under hunt_root."""
+    # Create some test structure: every directory in one makedirs call,
+    # then the files
+    os.makedirs(hunt_root / "subdir" / "nested")
+    for relpath, content in (
+        ("start.txt", b"Welcome!"),
+        ("subdir/file1.txt", b"Content 1"),
+    ):
+        # Binary mode: no text encoding setup for these ASCII payloads
+        with open(hunt_root / relpath, "wb") as f:
+            f.write(content)
+
+    return hunt_root
+
+
+@pytest.fixture(scope="session")
+def temp_hunt(tmp_path_factory):
+    """
+    Create a temporary treasure hunt directory, shared by the session.
+
+    Tests must not modify it; use mutable_hunt for that.
+    """
+    return _build_hunt(tmp_path_factory.mktemp("hunt_root") / "hunt")
+
+
+@pytest.fixture(scope="session")
+def paths(temp_hunt):
+    """Directories inside the shared hunt, computed once."""
+    subdir = temp_hunt / "subdir"
+    return HuntPaths(root=temp_hunt, subdir=subdir, nested=subdir / "nested")
+
+
+@pytest.fixture
+def mutable_hunt(tmp_path):
+    """Create a treasure hunt directory private to one test."""
+    return _build_hunt(tmp_path / "hunt")
+
+
+@pytest.fixture
+def mutable_state(mutable_hunt):
+    """Game state for a hunt private to one test."""
+    return GameState(
+        treasure_hunt_root=mutable_hunt,
+        current_dir=mutable_hunt,
+        treasure_key="SECRET123"
+    )
+
+
+@pytest.fixture(scope="session")
+def game_state_template(temp_hunt):
+    """Initial game state for the shared hunt; never handed to tests directly."""
+    return GameState(
+        treasure_hunt_root=temp_hunt,
+        current_dir=temp_hunt,
+        treasure_key="SECRET123"
+    )
+
+
+@pytest.fixture
+def game_state(game_state_template):
+    """Create a fresh copy of the initial game state for one test."""
+    return replace(game_state_template)
+
+
+@pytest.fixture(scope="session")
+def hunt_cache(request, tmp_path_factory):
+    """
+    Generated hunts, cached across test runs.
+
+    For tests that only consume a hunt; the generator's own tests must run
+    the generator instead, since a warm cache never calls it.
+
+    Returns get_hunt(**params) -> (hunt_path, result), where params are
+    passed to generate_treasure_hunt. Hunts are stored in pytest's cache
+    directory keyed by the parameters, the generator's source and its word
+    list, so changing the generator regenerates them, and each hunt is
+    looked up once per session. Callers must treat the returned tree as
+    read-only; the result dict is a fresh copy per call.
+    """
+    from treasure_hunt_agent import treasure_hunt_generator as generator
+
+    cache = getattr(request.config, "cache", None)
+    if cache is not None:
+        cache_root = cache.mkdir("hunts")
+    else:  # cacheprovider disabled: cache for this session only
+        cache_root = tmp_path_factory.mktemp("hunts")
+
+    fingerprint = hashlib.blake2b(Path(generator.__file__).read_bytes())
+    fingerprint.update("\n".join(generator._get_word_list()).encode())
+
+    loaded = {}
+
+    def get_hunt(**params):
+        params_key = json.dumps(params, sort_keys=True)
+        if params_key in loaded:
+            hunt_path, result = loaded[params_key]
+            return hunt_path, dict(result)
+
+        key = fingerprint.copy()
+        key.update(params_key.encode())
+        hunt_path = cache_root / key.hexdigest()[:32]
+        result_file = hunt_path.with_suffix(".json")
+
+        if not result_file.exists():
+            # Generate beside the final location, then move it into place
+            tmp_path = cache_root / f"{hunt_path.name}.{os.getpid()}.tmp"
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            result = generator.generate_treasure_hunt(base_path=str(tmp_path), **params)
+            result["config_file"] = str(hunt_path / ".treasure_hunt_config.json")
+
+            shutil.rmtree(hunt_path, ignore_errors=True)
+            os.replace(tmp_path, hunt_path)
+            result_file.write_text(json.dumps(result))
+
+        result = json.loads(result_file.read_text())
+        loaded[params_key] = hunt_path, result
+        return hunt_path, dict(result)
+
+    return get_hunt
+
+
+@pytest.fixture
+def sample_tools():
+    """Sample tool definitions for testing."""
+    return [
+        {
+            "name": "ls",
+            "description": "List files and directories",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "Path to list (defaults to current directory)"
+                    }
+                }
+            }
+        },
+        {
+            "name": "cat",
+            "description": "Read file contents",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Path to file"
+                    }
+                },
+                "required": ["file_path"]
+            }
+        }
+    ]
+
+
+@pytest.fixture
+def mock_genai(monkeypatch):
+    """Mock the google.generativeai module."""
+    # Plain Mocks rather than MagicMocks: nothing here needs magic methods
+    mock_model = Mock()
+    mock_configure = Mock()
+    mock_func_decl = Mock()
+    mock_tool = Mock()
+
+    # gemini_agent imports the SDK inside the functions that use it, so
+    # patching the SDK modules themselves is what those functions see
+    monkeypatch.setattr('google.generativeai.GenerativeModel', mock_model)
+    monkeypatch.setattr('google.generativeai.configure', mock_configure)
+    monkeypatch.setattr('google.generativeai.types.FunctionDeclaration', mock_func_decl)
+    monkeypatch.setattr('google.generativeai.types.Tool', mock_tool)
+    # Don't let a tool set built from these mocks outlive the test
+    monkeypatch.setattr('treasure_hunt_agent.gemini_agent._gemini_tools', None)
+
+    # Every chat session (including one started by reset) is fresh,
+    # records each exchange in its history and replies with the
+    # response the test set via set_response
+    current = {'response': None}
+
+    def start_chat(**kwargs):
+        chat = Mock()
+        chat.history = []
+
+        def send_message(message):
+            chat.history.extend([message, current['response']])
+            return current['response']
+
+        chat.send_message.side_effect = send_message
+        return chat
+
+    mock_model.return_value = Mock()
+    mock_model.return_value.start_chat.side_effect = start_chat
+
+    # Mock tool construction
+    mock_tool.return_value = Mock()
+
+    return {
+        'GenerativeModel': mock_model,
+        'configure': mock_configure,
+        'set_response': lambda response: current.__setitem__('response', response),
+        'FunctionDeclaration': mock_func_decl,
+        'Tool': mock_tool
+    }
@@ -21,55 +21,29 @@ def ask_human(state: GameState, question: str) -> str
 """
 
 import os
-import tempfile
-import shutil
-from pathlib import Path
-from dataclasses import dataclass
 
 import pytest
 
+from treasure_hunt_agent.game_tools import (
+    ask_human,
+    cat,
+    cd,
+    check_treasure,
+    give_up,
+    ls,
+    pwd,
+)
 
-@dataclass
-class GameState:
-    """Minimal GameState for testing."""
-    treasure_hunt_root: Path
-    current_dir: Path
-    treasure_key: str
-    game_over: bool = False
-    success: bool | None = None
+
+def _is_error(result: str) -> bool:
+    """Whether a tool result reports an error."""
+    result = result.lower()
+    return "error" in result or "invalid" in result or "not found" in result
 
 
 class TestGameTools:
     """Test the game tool functions."""
 
-    @pytest.fixture
-    def temp_hunt(self):
-        """Create a temporary treasure hunt directory."""
-        temp_dir = tempfile.mkdtemp()
-        hunt_root = Path(temp_dir) / "hunt"
-        hunt_root.mkdir()
-
-        # Create some test structure
-        (hunt_root / "start.txt").write_text("Welcome!")
-        (hunt_root / "subdir").mkdir()
-        (hunt_root / "subdir" / "file1.txt").write_text("Content 1")
-        (hunt_root / "subdir" / "nested").mkdir()
-        (hunt_root / "subdir" / "nested" / "file2.txt").write_text("Content 2")
-
-        yield hunt_root
-
-        # Cleanup
-        shutil.rmtree(temp_dir)
-
-    @pytest.fixture
-    def game_state(self, temp_hunt):
-        """Create a game state for testing."""
-        return GameState(
-            treasure_hunt_root=temp_hunt,
-            current_dir=temp_hunt,
-            treasure_key="SECRET123"
-        )
-
     def test_ls_current_directory(self, game_state):
         """
         Test ls lists current directory.
@@ -79,8 +53,6 @@ class TestGameTools:
         - Includes both files and directories
         - Does not show absolute paths
         """
-        from treasure_hunt_agent.game_tools import ls
-
         result = ls(game_state, ".")
 
         assert "start.txt" in result
@@ -95,44 +67,45 @@ class TestGameTools:
         - Can list relative subdirectory
         - Shows contents of that directory
         """
-        from treasure_hunt_agent.game_tools import ls
-
         result = ls(game_state, "subdir")
 
         assert "file1.txt" in result
         assert "nested" in result
 
-    def test_ls_rejects_escape_attempt(self, game_state):
-        """
-        Test ls rejects paths that escape hunt root.
-
-        Properties:
-        - Detects ../ attempts to escape
-        - Returns error message
-        - Does not expose information outside hunt
-        """
-        from treasure_hunt_agent.game_tools import ls
-
-        result = ls(game_state, "../..")
-
-        assert "error" in result.lower() or "invalid" in result.lower()
-        assert "root" in result.lower() or "boundary" in result.lower()
-
-    def test_ls_missing_directory(self, game_state):
-        """
-        Test ls handles missing directory.
+    @pytest.mark.parametrize(
+        "tool, arg, detail",
+        [
+            (ls, "../..", ("root", "boundary")),
+            (cd, "../../..", ("root", "boundary")),
+            (cat, "../../../etc/passwd", ("root", "boundary")),
+            (ls, "nonexistent", ("not found", "does not exist")),
+            (cd, "nonexistent", ("not found", "does not exist")),
+            (cat, "nonexistent.txt", ("not found", "does not exist")),
+        ],
+        ids=[
+            "ls-escape", "cd-escape", "cat-escape",
+            "ls-missing", "cd-missing", "cat-missing",
+        ],
+    )
+    def test_rejects_bad_paths(self, game_state, tool, arg, detail):
+        """
+        Test ls, cd and cat reject escaping and missing paths.
 
         Properties:
-        - Returns error message
-        - Does not crash
+        - Detects ../ attempts to escape the hunt root
+        - Handles missing files/directories without crashing
+        - Returns an error message saying why
+        - Does not modify current_dir
         """
-        from treasure_hunt_agent.game_tools import ls
+        original_dir = game_state.current_dir
 
-        result = ls(game_state, "nonexistent")
+        result = tool(game_state, arg)
 
-        assert "error" in result.lower() or "not found" in result.lower()
+        assert _is_error(result)
+        assert any(word in result.lower() for word in detail)
+        assert game_state.current_dir == original_dir
 
-    def test_cd_to_subdirectory(self, game_state):
+    def test_cd_to_subdirectory(self, game_state, paths):
         """
         Test cd changes to subdirectory.
 
@@ -141,14 +114,12 @@ class TestGameTools:
         - current_dir stays within hunt root
         - Returns confirmation message
         """
-        from treasure_hunt_agent.game_tools import cd
-
         result = cd(game_state, "subdir")
 
-        assert game_state.current_dir == game_state.treasure_hunt_root / "subdir"
+        assert game_state.current_dir == paths.subdir
         assert "subdir" in result.lower()
 
-    def test_cd_parent_directory_within_bounds(self, game_state):
+    def test_cd_parent_directory_within_bounds(self, game_state, paths):
         """
         Test cd can go to parent directory if within bounds.
 
@@ -156,50 +127,13 @@ class TestGameTools:
         - Allows ../ if result is within hunt root
         - Updates current_dir correctly
         """
-        from treasure_hunt_agent.game_tools import cd
-
         # First go to subdir
-        game_state.current_dir = game_state.treasure_hunt_root / "subdir" / "nested"
+        game_state.current_dir = paths.nested
 
         # Then go back up
         result = cd(game_state, "..")
 
-        assert game_state.current_dir == game_state.treasure_hunt_root / "subdir"
-
-    def test_cd_rejects_escape_attempt(self, game_state):
-        """
-        Test cd rejects attempts to escape hunt root.
-
-        Properties:
-        - Detects paths that would escape
-        - Does not modify current_dir
-        - Returns error message
-        """
-        from treasure_hunt_agent.game_tools import cd
-
-        original_dir = game_state.current_dir
-
-        result = cd(game_state, "../../..")
-
-        assert game_state.current_dir == original_dir
-        assert "error" in result.lower() or "invalid" in result.lower()
-
-    def test_cd_missing_directory(self, game_state):
-        """
-        Test cd handles missing directory.
-
-        Properties:
-        - Returns error message
-        - Does not modify current_dir
-        """
-        from treasure_hunt_agent.game_tools import cd
-
-        original_dir = game_state.current_dir
-
-        result = cd(game_state, "nonexistent")
-
-        assert game_state.current_dir == original_dir
-        assert "error" in result.lower() or "not found" in result.lower()
+        assert game_state.current_dir == paths.subdir
 
     def test_cat_reads_file(self, game_state):
         """
@@ -209,8 +143,6 @@ class TestGameTools:
         - Returns file contents
         - Works with relative paths
         """
-        from treasure_hunt_agent.game_tools import cat
-
         result = cat(game_state, "start.txt")
 
         assert result == "Welcome!"
@@ -223,13 +155,11 @@ class TestGameTools:
         - Resolves relative paths correctly
         - Returns file contents
         """
-        from treasure_hunt_agent.game_tools import cat
-
         result = cat(game_state, "subdir/file1.txt")
 
         assert result == "Content 1"
 
-    def test_cat_from_different_current_dir(self, game_state):
+    def test_cat_from_different_current_dir(self, game_state, paths):
         """
         Test cat works when current_dir is not root.
 
@@ -237,9 +167,7 @@ class TestGameTools:
         - Resolves paths relative to current_dir
         - Can use ../ to go up
         """
-        from treasure_hunt_agent.game_tools import cat
-
-        game_state.current_dir = game_state.treasure_hunt_root / "subdir"
+        game_state.current_dir = paths.subdir
 
         result = cat(game_state, "file1.txt")
         assert result == "Content 1"
@@ -247,48 +175,34 @@ class TestGameTools:
         result = cat(game_state, "../start.txt")
         assert result == "Welcome!"
 
-    def test_cat_rejects_escape_attempt(self, game_state):
-        """
-        Test cat rejects paths that escape hunt root.
-
-        Properties:
-        - Detects escape attempts
-        - Returns error message
-        - Does not read files outside hunt
-        """
-        from treasure_hunt_agent.game_tools import cat
-
-        result = cat(game_state, "../../../etc/passwd")
-
-        assert "error" in result.lower() or "invalid" in result.lower()
-
-    def test_cat_missing_file(self, game_state):
+    def test_cat_directory_instead_of_file(self, game_state):
         """
-        Test cat handles missing file.
+        Test cat handles directory instead of file.
 
         Properties:
         - Returns error message
-        - Does not crash
+        - Indicates it's a directory not a file
         """
-        from treasure_hunt_agent.game_tools import cat
-
-        result = cat(game_state, "nonexistent.txt")
+        result = cat(game_state, "subdir")
 
-        assert "error" in result.lower() or "not found" in result.lower()
+        assert _is_error(result)
+        assert "directory" in result.lower()
 
-    def test_cat_directory_instead_of_file(self, game_state):
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+    def test_cat_rejects_non_regular_file(self, mutable_hunt, mutable_state):
         """
-        Test cat handles directory instead of file.
+        Test cat refuses files that are not regular files.
 
         Properties:
-        - Returns error message
-        - Indicates it's a directory not a file
+        - A FIFO is rejected with an error instead of being opened
+        - The error says it is not a regular file
         """
-        from treasure_hunt_agent.game_tools import cat
+        os.mkfifo(mutable_hunt / "pipe")
 
-        result = cat(game_state, "subdir")
+        result = cat(mutable_state, "pipe")
 
-        assert "error" in result.lower() or "directory" in result.lower()
+        assert _is_error(result)
+        assert "not a regular file" in result.lower()
 
     def test_pwd_returns_current_directory(self, game_state):
         """
@@ -298,13 +212,11 @@ class TestGameTools:
         - Returns path relative to hunt root
         - Shows "." when at root
         """
-        from treasure_hunt_agent.game_tools import pwd
-
         result = pwd(game_state)
 
         assert result == "." or result == "/"
 
-    def test_pwd_in_subdirectory(self, game_state):
+    def test_pwd_in_subdirectory(self, game_state, paths):
         """
         Test pwd returns correct path in subdirectory.
 
@@ -312,9 +224,7 @@ class TestGameTools:
         - Returns relative path
         - Does not include hunt root in output
         """
-        from treasure_hunt_agent.game_tools import pwd
-
-        game_state.current_dir = game_state.treasure_hunt_root / "subdir" / "nested"
+        game_state.current_dir = paths.nested
 
         result = pwd(game_state)
 
@@ -329,8 +239,6 @@ class TestGameTools:
         - Sets game_over=True
         - Sets success=True
         """
-        from treasure_hunt_agent.game_tools import check_treasure
-
         result = check_treasure(game_state, "SECRET123")
 
         assert isinstance(result, dict)
@@ -347,8 +255,6 @@ class TestGameTools:
         - Does not set game_over
         - Does not set success
         """
-        from treasure_hunt_agent.game_tools import check_treasure
-
         result = check_treasure(game_state, "WRONG")
 
         assert isinstance(result, dict)
@@ -365,8 +271,6 @@ class TestGameTools:
         - Sets game_over=True
         - Sets success=False
         """
-        from treasure_hunt_agent.game_tools import give_up
-
         result = give_up(game_state)
 
         assert isinstance(result, dict)
@@ -382,8 +286,6 @@ class TestGameTools:
         - Returns string indicating human input needed
         - Contains the question
         """
-        from treasure_hunt_agent.game_tools import ask_human
-
         result = ask_human(game_state, "Where should I look?")
 
         assert isinstance(result, str)
@@ -398,17 +300,75 @@ class TestGameTools:
         - cd rejects absolute paths
         - cat rejects absolute paths
         """
-        from treasure_hunt_agent.game_tools import ls, cd, cat
+        for tool in (ls, cd, cat):
+            original_dir = game_state.current_dir
+            result = tool(game_state, "/etc/passwd")
+            assert _is_error(result), tool.__name__
+            assert game_state.current_dir == original_dir
 
-        abs_path = "/etc/passwd"
+    def test_ls_sees_directory_changes(self, mutable_hunt, mutable_state):
+        """
+        Test ls output tracks changes to a directory between calls.
+
+        Properties:
+        - Repeated listings of an unchanged directory are identical
+        - A listing reflects files added after an earlier ls
+        """
+        first = ls(mutable_state, "subdir")
+        assert ls(mutable_state, "subdir") == first
 
-        ls_result = ls(game_state, abs_path)
-        assert "error" in ls_result.lower() or "invalid" in ls_result.lower()
+        (mutable_hunt / "subdir" / "added.txt").write_text("New")
+        # Bump the mtime explicitly; coarse filesystem timestamps could
+        # otherwise leave it unchanged within the same tick
+        st = os.stat(mutable_hunt / "subdir")
+        os.utime(mutable_hunt / "subdir", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
 
-        original_dir = game_state.current_dir
-        cd_result = cd(game_state, abs_path)
-        assert game_state.current_dir == original_dir
-        assert "error" in cd_result.lower() or "invalid" in cd_result.lower()
+        assert "added.txt" in ls(mutable_state, "subdir")
+
+    def test_cat_sees_file_changes(self, mutable_hunt, mutable_state):
+        """
+        Test cat returns current contents after a file is rewritten.
+
+        Properties:
+        - Repeated reads of an unchanged file return the same text
+        - A read after the file changes returns the new contents
+        """
+        assert cat(mutable_state, "start.txt") == "Welcome!"
+        assert cat(mutable_state, "start.txt") == "Welcome!"
+
+        (mutable_hunt / "start.txt").write_text("Changed contents")
 
-        cat_result = cat(game_state, abs_path)
-        assert "error" in cat_result.lower() or "invalid" in cat_result.lower()
+        assert cat(mutable_state, "start.txt") == "Changed contents"
+
+    def test_cat_sees_file_created_after_miss(self, mutable_hunt, mutable_state):
+        """
+        Test cat finds a file that was missing on an earlier call.
+
+        Properties:
+        - A missing file is reported as an error
+        - Once the file is created, cat returns its contents
+        """
+        assert _is_error(cat(mutable_state, "later.txt"))
+
+        (mutable_hunt / "later.txt").write_text("Here now")
+
+        assert cat(mutable_state, "later.txt") == "Here now"
+
+    def test_ls_with_limit(self, game_state):
+        """
+        Test ls can truncate long listings.
+
+        Properties:
+        - Only the first `limit` entries in sorted order are listed
+        - Truncated listings say how many entries were left out
+        - Non-positive and non-numeric limits are rejected
+        """
+        full = ls(game_state, "subdir")
+        limited = ls(game_state, "subdir", limit=1)
+
+        assert limited.startswith("file1.txt")
+        assert "nested" not in limited
+        assert "1 more" in limited
+        assert ls(game_state, "subdir", limit=10) == full
+        assert _is_error(ls(game_state, "subdir", limit=0))
+        assert _is_error(ls(game_state, "subdir", limit="many"))
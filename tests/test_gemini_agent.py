@@ -39,70 +39,43 @@ class ToolResult:
     result: str | dict
 """
 
-import os
-from unittest.mock import Mock, MagicMock, patch
+from types import SimpleNamespace as ns
 
 import pytest
 
+from treasure_hunt_agent.gemini_agent import GeminiAgent, ToolCall, ToolResult
 
-class TestGeminiAgent:
-    """Test the GeminiAgent class."""
 
-    @pytest.fixture
-    def sample_tools(self):
-        """Sample tool definitions for testing."""
-        return [
-            {
-                "name": "ls",
-                "description": "List files and directories",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Path to list (defaults to current directory)"
-                        }
-                    }
-                }
-            },
-            {
-                "name": "cat",
-                "description": "Read file contents",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to file"
-                        }
-                    },
-                    "required": ["file_path"]
-                }
-            }
-        ]
+def _response(parts, finish_reason, text=None, pt=10, ct=5):
+    """Plain data stand-in for a Gemini response with one candidate."""
+    return ns(
+        text=text,
+        candidates=[ns(finish_reason=finish_reason, content=ns(parts=parts))],
+        usage_metadata=ns(
+            prompt_token_count=pt,
+            candidates_token_count=ct,
+            total_token_count=pt + ct,
+        ),
+    )
+
+
+def _function_call_part(name, args):
+    """Response part carrying a single function call."""
+    return ns(text=None, function_call=ns(name=name, args=args))
+
 
-    @pytest.fixture(autouse=True)
-    def mock_genai(self):
-        """Mock the google.generativeai module."""
-        with patch('treasure_hunt_agent.gemini_agent.genai.GenerativeModel') as mock_model, \
-             patch('treasure_hunt_agent.gemini_agent.genai.configure') as mock_configure, \
-             patch('treasure_hunt_agent.gemini_agent.FunctionDeclaration') as mock_func_decl, \
-             patch('treasure_hunt_agent.gemini_agent.Tool') as mock_tool:
-            # Set up mock model and chat
-            mock_chat = Mock()
-            mock_chat.history = []
-            mock_model.return_value.start_chat.return_value = mock_chat
-
-            # Mock tool construction
-            mock_tool.return_value = Mock()
-
-            yield {
-                'GenerativeModel': mock_model,
-                'configure': mock_configure,
-                'chat': mock_chat,
-                'FunctionDeclaration': mock_func_decl,
-                'Tool': mock_tool
-            }
+@pytest.fixture(scope="module")
+def text_response_factory():
+    """Factory for text-only LLM responses with the given text, finish reason and usage."""
+    def make(text="Response", finish="STOP", pt=10, ct=5):
+        return _response([ns(text=text, function_call=None)], finish, text=text, pt=pt, ct=ct)
+
+    return make
+
+
+@pytest.mark.usefixtures("mock_genai")
+class TestGeminiAgent:
+    """Test the GeminiAgent class."""
 
     def test_agent_initialization(self, sample_tools, mock_genai):
         """
@@ -115,8 +88,6 @@ class TestGeminiAgent:
         - Initializes empty conversation history
         - Creates GenerativeModel instance
         """
-        from treasure_hunt_agent.gemini_agent import GeminiAgent
-
         agent = GeminiAgent(
             model_name="gemini-1.5-flash",
             system_instructions="You are a helpful agent",
@@ -132,7 +103,7 @@ class TestGeminiAgent:
         assert isinstance(history, list)
         assert len(history) == 0
 
-    def test_step_with_initial_message(self, sample_tools, mock_genai):
+    def test_step_with_initial_message(self, sample_tools, mock_genai, text_response_factory):
         """
         Test agent step with initial game message.
 
@@ -142,23 +113,10 @@ class TestGeminiAgent:
         - Returns AgentResponse
         - Updates conversation history
         """
-        from treasure_hunt_agent.gemini_agent import GeminiAgent
-
         # Mock LLM response (text only, no tool calls)
-        mock_response = Mock()
-        mock_response.text = "I'll start exploring"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].finish_reason = "STOP"
-        mock_response.candidates[0].content.parts = [Mock(text="I'll start exploring")]
-        mock_response.usage_metadata = Mock(
-            prompt_token_count=10,
-            candidates_token_count=5,
-            total_token_count=15
-        )
+        mock_response = text_response_factory("I'll start exploring")
 
-        mock_chat = Mock()
-        mock_chat.send_message.return_value = mock_response
-        mock_genai.GenerativeModel.return_value.start_chat.return_value = mock_chat
+        mock_genai['set_response'](mock_response)
 
         agent = GeminiAgent(
             model_name="gemini-1.5-flash",
@@ -183,31 +141,12 @@ class TestGeminiAgent:
         - Each tool call has name, arguments, id
         - finish_reason indicates tool calls
         """
-        from treasure_hunt_agent.gemini_agent import GeminiAgent, ToolCall
-
         # Mock LLM response with tool calls
-        mock_function_call = Mock()
-        mock_function_call.name = "ls"
-        mock_function_call.args = {"path": "."}
-
-        mock_part = Mock()
-        mock_part.function_call = mock_function_call
-        mock_part.text = None
-
-        mock_response = Mock()
-        mock_response.text = None
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].finish_reason = "FUNCTION_CALL"
-        mock_response.candidates[0].content.parts = [mock_part]
-        mock_response.usage_metadata = Mock(
-            prompt_token_count=10,
-            candidates_token_count=5,
-            total_token_count=15
+        mock_response = _response(
+            [_function_call_part("ls", {"path": "."})], "FUNCTION_CALL"
         )
 
-        mock_chat = Mock()
-        mock_chat.send_message.return_value = mock_response
-        mock_genai.GenerativeModel.return_value.start_chat.return_value = mock_chat
+        mock_genai['set_response'](mock_response)
 
         agent = GeminiAgent(
             model_name="gemini-1.5-flash",
@@ -224,7 +163,7 @@ class TestGeminiAgent:
         assert response.tool_calls[0].arguments == {"path": "."}
         assert response.finish_reason == "FUNCTION_CALL"
 
-    def test_step_with_tool_results(self, sample_tools, mock_genai):
+    def test_step_with_tool_results(self, sample_tools, mock_genai, text_response_factory):
         """
         Test agent step with tool results as input.
 
@@ -233,23 +172,10 @@ class TestGeminiAgent:
         - Feeds results back to LLM correctly
         - LLM can respond with text or more tool calls
         """
-        from treasure_hunt_agent.gemini_agent import GeminiAgent, ToolResult
-
         # Mock LLM response after receiving tool results
-        mock_response = Mock()
-        mock_response.text = "I see the start.txt file"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].finish_reason = "STOP"
-        mock_response.candidates[0].content.parts = [Mock(text="I see the start.txt file")]
-        mock_response.usage_metadata = Mock(
-            prompt_token_count=15,
-            candidates_token_count=10,
-            total_token_count=25
-        )
+        mock_response = text_response_factory("I see the start.txt file", pt=15, ct=10)
 
-        mock_chat = Mock()
-        mock_chat.send_message.return_value = mock_response
-        mock_genai.GenerativeModel.return_value.start_chat.return_value = mock_chat
+        mock_genai['set_response'](mock_response)
 
         agent = GeminiAgent(
             model_name="gemini-1.5-flash",
@@ -271,7 +197,7 @@ class TestGeminiAgent:
         assert response.text == "I see the start.txt file"
         assert response.finish_reason == "STOP"
 
-    def test_conversation_history(self, sample_tools, mock_genai):
+    def test_conversation_history(self, sample_tools, mock_genai, text_response_factory):
         """
         Test that conversation history is maintained correctly.
 
@@ -281,23 +207,9 @@ class TestGeminiAgent:
         - History includes user messages, assistant messages, tool calls, tool results
         - get_history() returns the history
         """
-        from treasure_hunt_agent.gemini_agent import GeminiAgent
-
-        mock_response = Mock()
-        mock_response.text = "Response"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].finish_reason = "STOP"
-        mock_response.candidates[0].content.parts = [Mock(text="Response")]
-        mock_response.usage_metadata = Mock(
-            prompt_token_count=10,
-            candidates_token_count=5,
-            total_token_count=15
-        )
+        mock_response = text_response_factory()
 
-        mock_chat = Mock()
-        mock_chat.send_message.return_value = mock_response
-        mock_chat.history = []
-        mock_genai.GenerativeModel.return_value.start_chat.return_value = mock_chat
+        mock_genai['set_response'](mock_response)
 
         agent = GeminiAgent(
             model_name="gemini-1.5-flash",
@@ -313,7 +225,7 @@ class TestGeminiAgent:
         history = agent.get_history()
         assert len(history) > 0
 
-    def test_token_usage_tracking(self, sample_tools, mock_genai):
+    def test_token_usage_tracking(self, sample_tools, mock_genai, text_response_factory):
         """
         Test that token usage is tracked correctly.
 
@@ -322,22 +234,9 @@ class TestGeminiAgent:
         - Usage contains prompt_tokens, completion_tokens, total_tokens
         - Token counts are accurate
         """
-        from treasure_hunt_agent.gemini_agent import GeminiAgent
-
-        mock_response = Mock()
-        mock_response.text = "Response"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].finish_reason = "STOP"
-        mock_response.candidates[0].content.parts = [Mock(text="Response")]
-        mock_response.usage_metadata = Mock(
-            prompt_token_count=100,
-            candidates_token_count=50,
-            total_token_count=150
-        )
+        mock_response = text_response_factory(pt=100, ct=50)
 
-        mock_chat = Mock()
-        mock_chat.send_message.return_value = mock_response
-        mock_genai.GenerativeModel.return_value.start_chat.return_value = mock_chat
+        mock_genai['set_response'](mock_response)
 
         agent = GeminiAgent(
             model_name="gemini-1.5-flash",
@@ -354,7 +253,7 @@ class TestGeminiAgent:
         assert response.usage["completion_tokens"] == 50
         assert response.usage["total_tokens"] == 150
 
-    def test_reset(self, sample_tools, mock_genai):
+    def test_reset(self, sample_tools, mock_genai, text_response_factory):
         """
         Test that agent can be reset.
 
@@ -363,23 +262,9 @@ class TestGeminiAgent:
         - Agent can continue after reset
         - New conversation starts fresh
         """
-        from treasure_hunt_agent.gemini_agent import GeminiAgent
-
-        mock_response = Mock()
-        mock_response.text = "Response"
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].finish_reason = "STOP"
-        mock_response.candidates[0].content.parts = [Mock(text="Response")]
-        mock_response.usage_metadata = Mock(
-            prompt_token_count=10,
-            candidates_token_count=5,
-            total_token_count=15
-        )
+        mock_response = text_response_factory()
 
-        mock_chat = Mock()
-        mock_chat.send_message.return_value = mock_response
-        mock_chat.history = []
-        mock_genai.GenerativeModel.return_value.start_chat.return_value = mock_chat
+        mock_genai['set_response'](mock_response)
 
         agent = GeminiAgent(
             model_name="gemini-1.5-flash",
@@ -409,39 +294,16 @@ class TestGeminiAgent:
         - All tool calls are captured
         - Tool calls maintain order
         """
-        from treasure_hunt_agent.gemini_agent import GeminiAgent
-
         # Mock LLM response with multiple tool calls
-        mock_fc1 = Mock()
-        mock_fc1.name = "ls"
-        mock_fc1.args = {"path": "."}
-
-        mock_fc2 = Mock()
-        mock_fc2.name = "cat"
-        mock_fc2.args = {"file_path": "start.txt"}
-
-        mock_part1 = Mock()
-        mock_part1.function_call = mock_fc1
-        mock_part1.text = None
-
-        mock_part2 = Mock()
-        mock_part2.function_call = mock_fc2
-        mock_part2.text = None
-
-        mock_response = Mock()
-        mock_response.text = None
-        mock_response.candidates = [Mock()]
-        mock_response.candidates[0].finish_reason = "FUNCTION_CALL"
-        mock_response.candidates[0].content.parts = [mock_part1, mock_part2]
-        mock_response.usage_metadata = Mock(
-            prompt_token_count=10,
-            candidates_token_count=5,
-            total_token_count=15
+        mock_response = _response(
+            [
+                _function_call_part("ls", {"path": "."}),
+                _function_call_part("cat", {"file_path": "start.txt"}),
+            ],
+            "FUNCTION_CALL",
         )
 
-        mock_chat = Mock()
-        mock_chat.send_message.return_value = mock_response
-        mock_genai.GenerativeModel.return_value.start_chat.return_value = mock_chat
+        mock_genai['set_response'](mock_response)
 
         agent = GeminiAgent(
             model_name="gemini-1.5-flash",
@@ -35,24 +35,24 @@ class GameResult:
     error: str | None
 """
 
-import tempfile
-import shutil
-from pathlib import Path
-from unittest.mock import Mock, MagicMock
 from dataclasses import dataclass
 
 import pytest
 
+from treasure_hunt_agent.game_tools import TOOL_DEFINITIONS, TOOL_FUNCS
+from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
 
-# Mock agent response classes
-@dataclass
+
+# Mock agent response classes, frozen so module-level responses can be
+# shared between tests
+@dataclass(frozen=True)
 class MockToolCall:
     name: str
     arguments: dict
     id: str = "call_123"
 
 
-@dataclass
+@dataclass(frozen=True)
 class MockAgentResponse:
     text: str | None
     tool_calls: list[MockToolCall] | None
@@ -60,36 +60,87 @@ class MockAgentResponse:
     usage: dict
 
 
-class TestTreasureHuntGame:
-    """Test the TreasureHuntGame class."""
+# Canned responses that don't depend on the hunt, built once
+USAGE = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+LS_CALL = MockToolCall(name="ls", arguments={"path": "."})
+PWD_CALL = MockToolCall(name="pwd", arguments={})
+
+LS_RESP = MockAgentResponse(
+    text="Let me list files",
+    tool_calls=[LS_CALL],
+    finish_reason="FUNCTION_CALL",
+    usage=USAGE
+)
+LS_PWD_RESP = MockAgentResponse(
+    text="Testing",
+    tool_calls=[LS_CALL, PWD_CALL],
+    finish_reason="FUNCTION_CALL",
+    usage=USAGE
+)
+GIVE_UP_RESP = MockAgentResponse(
+    text="I give up",
+    tool_calls=[MockToolCall(name="give_up", arguments={})],
+    finish_reason="FUNCTION_CALL",
+    usage=USAGE
+)
+
+
+def check_treasure_response(key, usage=USAGE):
+    """Response that checks `key` as the treasure."""
+    return MockAgentResponse(
+        text="Checking key",
+        tool_calls=[MockToolCall(name="check_treasure", arguments={"key": key})],
+        finish_reason="FUNCTION_CALL",
+        usage=usage
+    )
+
+
+class StubAgent:
+    """
+    Agent double that replays canned responses.
+
+    Each step() returns the next response, repeating the last one once
+    they run out, and records its input in `calls`.
+    """
+
+    def __init__(self, responses):
+        self._responses = responses
+        self._i = 0
+        self.calls = []
+
+    def step(self, game_input):
+        self.calls.append(game_input)
+        response = self._responses[min(self._i, len(self._responses) - 1)]
+        self._i += 1
+        return response
+
+    def get_history(self):
+        return []
+
+    def reset(self):
+        pass
 
-    @pytest.fixture
-    def temp_hunt(self):
-        """Create a simple treasure hunt."""
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
 
-        temp_dir = tempfile.mkdtemp()
-        hunt_path = Path(temp_dir) / "hunt"
+class TestTreasureHuntGame:
+    """Test the TreasureHuntGame class."""
 
-        result = generate_treasure_hunt(
-            base_path=str(hunt_path),
-            depth=3,
-            seed=42
-        )
+    @pytest.fixture(scope="module")
+    def _golden_hunt(self, hunt_cache):
+        """Generate the simple treasure hunt once (cached across runs)."""
+        return hunt_cache(depth=3, seed=42)
 
-        yield hunt_path, result
+    @pytest.fixture
+    def temp_hunt(self, _golden_hunt):
+        """
+        Create a simple treasure hunt.
 
-        shutil.rmtree(temp_dir)
+        The game's tools only read the hunt, so every test can share the
+        generated tree without copying it.
+        """
+        hunt_path, result = _golden_hunt
+        return hunt_path, dict(result)
 
-    @pytest.fixture
-    def mock_agent(self):
-        """Create a mock agent."""
-        agent = Mock()
-        agent.get_history = Mock(return_value=[])
-        agent.reset = Mock()
-        return agent
-
-    def test_game_initialization(self, temp_hunt, mock_agent):
+    def test_game_initialization(self, temp_hunt):
         """
         Test game initializes correctly.
 
@@ -99,13 +150,11 @@ class TestTreasureHuntGame:
         - Stores agent reference
         - Sets initial values (turns=0, game_over=False)
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
         game = TreasureHuntGame(
             hunt_path=str(hunt_path),
-            agent=mock_agent,
+            agent=StubAgent([]),
             max_turns=50,
             max_tokens=10000
         )
@@ -117,7 +166,23 @@ class TestTreasureHuntGame:
         assert state.game_over is False
         assert state.treasure_key == hunt_result['treasure_key']
 
-    def test_game_runs_agent_step(self, temp_hunt, mock_agent):
+    def test_game_tools_from_tool_funcs(self, temp_hunt):
+        """
+        Test the game dispatches through the shared TOOL_FUNCS table.
+
+        Properties:
+        - TOOL_FUNCS has an implementation for every tool definition
+        - game.tools is a copy of TOOL_FUNCS, so per-game overrides stay local
+        """
+        hunt_path, hunt_result = temp_hunt
+
+        game = TreasureHuntGame(str(hunt_path), StubAgent([]))
+
+        assert set(TOOL_FUNCS) == {tool["name"] for tool in TOOL_DEFINITIONS}
+        assert game.tools == TOOL_FUNCS
+        assert game.tools is not TOOL_FUNCS
+
+    def test_game_runs_agent_step(self, temp_hunt):
         """
         Test game calls agent.step() in the loop.
 
@@ -125,31 +190,20 @@ class TestTreasureHuntGame:
         - Calls agent.step() with initial message
         - Initial message includes start file name
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
-        # Mock agent to return success immediately
-        mock_agent.step = Mock(return_value=MockAgentResponse(
-            text="I'll check the key",
-            tool_calls=[MockToolCall(
-                name="check_treasure",
-                arguments={"key": hunt_result['treasure_key']}
-            )],
-            finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
+        # Agent returns success immediately
+        agent = StubAgent([check_treasure_response(hunt_result['treasure_key'])])
 
-        game = TreasureHuntGame(str(hunt_path), mock_agent)
+        game = TreasureHuntGame(str(hunt_path), agent)
         result = game.run()
 
         # Should have called agent.step with initial message
-        assert mock_agent.step.called
-        first_call = mock_agent.step.call_args_list[0]
-        initial_message = first_call[0][0]
+        assert len(agent.calls) > 0
+        initial_message = agent.calls[0]
         assert hunt_result['start_file'] in initial_message
 
-    def test_game_executes_tools(self, temp_hunt, mock_agent):
+    def test_game_executes_tools(self, temp_hunt):
         """
         Test game executes tool calls.
 
@@ -158,40 +212,20 @@ class TestTreasureHuntGame:
         - Feeds results back to agent
         - Logs tool calls
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
         # Agent makes ls call, then finds treasure
-        call_count = 0
-
-        def mock_step(game_input):
-            nonlocal call_count
-            call_count += 1
-
-            if call_count == 1:
-                # First call: list directory
-                return MockAgentResponse(
-                    text="Let me list files",
-                    tool_calls=[MockToolCall(name="ls", arguments={"path": "."})],
-                    finish_reason="FUNCTION_CALL",
-                    usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-                )
-            else:
-                # Second call: check treasure
-                return MockAgentResponse(
-                    text="Found it",
-                    tool_calls=[MockToolCall(
-                        name="check_treasure",
-                        arguments={"key": hunt_result['treasure_key']}
-                    )],
-                    finish_reason="FUNCTION_CALL",
-                    usage={"prompt_tokens": 20, "completion_tokens": 10, "total_tokens": 30}
-                )
-
-        mock_agent.step = Mock(side_effect=mock_step)
-
-        game = TreasureHuntGame(str(hunt_path), mock_agent)
+        agent = StubAgent([
+            # First call: list directory
+            LS_RESP,
+            # Second call: check treasure
+            check_treasure_response(
+                hunt_result['treasure_key'],
+                usage={"prompt_tokens": 20, "completion_tokens": 10, "total_tokens": 30}
+            ),
+        ])
+
+        game = TreasureHuntGame(str(hunt_path), agent)
         result = game.run()
 
         # Should have executed tools
@@ -199,120 +233,60 @@ class TestTreasureHuntGame:
         assert any(tc['name'] == 'ls' for tc in result.tool_calls)
         assert any(tc['name'] == 'check_treasure' for tc in result.tool_calls)
 
-    def test_game_success_on_correct_treasure(self, temp_hunt, mock_agent):
-        """
-        Test game succeeds when agent finds treasure.
-
-        Properties:
-        - success=True when check_treasure returns correct
-        - game_over=True
-        - end_reason="treasure_found"
-        - treasure_key_found is set
-        """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
-        hunt_path, hunt_result = temp_hunt
-
-        mock_agent.step = Mock(return_value=MockAgentResponse(
-            text="Checking key",
-            tool_calls=[MockToolCall(
-                name="check_treasure",
-                arguments={"key": hunt_result['treasure_key']}
-            )],
-            finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
-
-        game = TreasureHuntGame(str(hunt_path), mock_agent)
-        result = game.run()
-
-        assert result.success is True
-        assert result.end_reason == "treasure_found"
-        assert result.treasure_key_found == hunt_result['treasure_key']
-
-    def test_game_failure_on_give_up(self, temp_hunt, mock_agent):
-        """
-        Test game fails when agent gives up.
-
-        Properties:
-        - success=False
-        - game_over=True
-        - end_reason="gave_up"
-        """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
-        hunt_path, hunt_result = temp_hunt
-
-        mock_agent.step = Mock(return_value=MockAgentResponse(
-            text="I give up",
-            tool_calls=[MockToolCall(name="give_up", arguments={})],
-            finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
-
-        game = TreasureHuntGame(str(hunt_path), mock_agent)
-        result = game.run()
-
-        assert result.success is False
-        assert result.end_reason == "gave_up"
-
-    def test_game_failure_on_max_turns(self, temp_hunt, mock_agent):
-        """
-        Test game fails on reaching max turns.
-
-        Properties:
-        - success=False
-        - end_reason="max_turns"
-        - turns_taken == max_turns
-        """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
-        hunt_path, hunt_result = temp_hunt
-
-        # Agent just keeps listing directory
-        mock_agent.step = Mock(return_value=MockAgentResponse(
-            text="Listing",
-            tool_calls=[MockToolCall(name="ls", arguments={"path": "."})],
-            finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
-
-        game = TreasureHuntGame(str(hunt_path), mock_agent, max_turns=3)
-        result = game.run()
-
-        assert result.success is False
-        assert result.end_reason == "max_turns"
-        assert result.turns_taken == 3
-
-    def test_game_failure_on_max_tokens(self, temp_hunt, mock_agent):
+    @pytest.mark.parametrize(
+        "response, game_kwargs, success, end_reason",
+        [
+            (check_treasure_response, {}, True, "treasure_found"),
+            (lambda key: GIVE_UP_RESP, {}, False, "gave_up"),
+            # Agent just keeps listing directory; one turn is enough
+            (lambda key: LS_RESP, {"max_turns": 1}, False, "max_turns"),
+            (
+                # Agent's first turn alone exceeds the token budget
+                lambda key: MockAgentResponse(
+                    text="Listing",
+                    tool_calls=[LS_CALL],
+                    finish_reason="FUNCTION_CALL",
+                    usage={"prompt_tokens": 8, "completion_tokens": 8, "total_tokens": 16}
+                ),
+                {"max_tokens": 10},
+                False,
+                "max_tokens",
+            ),
+        ],
+        ids=["treasure_found", "gave_up", "max_turns", "max_tokens"],
+    )
+    def test_game_end_conditions(
+        self, temp_hunt, response, game_kwargs, success, end_reason
+    ):
         """
-        Test game fails on reaching max tokens.
+        Test each way the game can end.
 
         Properties:
-        - success=False
-        - end_reason="max_tokens"
-        - total_tokens >= max_tokens
+        - success=True and end_reason="treasure_found" when check_treasure
+          returns correct, with treasure_key_found set
+        - success=False and end_reason="gave_up" when the agent gives up
+        - success=False and end_reason="max_turns" on reaching max turns,
+          with turns_taken == max_turns
+        - success=False and end_reason="max_tokens" on reaching max tokens,
+          with total_tokens >= max_tokens
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
-        # Agent uses lots of tokens
-        mock_agent.step = Mock(return_value=MockAgentResponse(
-            text="Listing",
-            tool_calls=[MockToolCall(name="ls", arguments={"path": "."})],
-            finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 500, "completion_tokens": 500, "total_tokens": 1000}
-        ))
+        agent = StubAgent([response(hunt_result['treasure_key'])])
 
-        game = TreasureHuntGame(str(hunt_path), mock_agent, max_tokens=2500)
+        game = TreasureHuntGame(str(hunt_path), agent, **game_kwargs)
         result = game.run()
 
-        assert result.success is False
-        assert result.end_reason == "max_tokens"
-        assert result.total_tokens >= 2500
+        assert result.success is success
+        assert result.end_reason == end_reason
+        if end_reason == "treasure_found":
+            assert result.treasure_key_found == hunt_result['treasure_key']
+        elif end_reason == "max_turns":
+            assert result.turns_taken == game_kwargs["max_turns"]
+        elif end_reason == "max_tokens":
+            assert result.total_tokens >= game_kwargs["max_tokens"]
 
-    def test_game_tracks_token_usage(self, temp_hunt, mock_agent):
+    def test_game_tracks_token_usage(self, temp_hunt):
         """
         Test game tracks token usage correctly.
 
@@ -321,44 +295,29 @@ class TestTreasureHuntGame:
         - prompt_tokens and completion_tokens are separated
         - Matches agent's reported usage
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
-        call_count = 0
-
-        def mock_step(game_input):
-            nonlocal call_count
-            call_count += 1
-
-            if call_count == 1:
-                return MockAgentResponse(
-                    text="First",
-                    tool_calls=[MockToolCall(name="ls", arguments={"path": "."})],
-                    finish_reason="FUNCTION_CALL",
-                    usage={"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
-                )
-            else:
-                return MockAgentResponse(
-                    text="Second",
-                    tool_calls=[MockToolCall(
-                        name="check_treasure",
-                        arguments={"key": hunt_result['treasure_key']}
-                    )],
-                    finish_reason="FUNCTION_CALL",
-                    usage={"prompt_tokens": 200, "completion_tokens": 100, "total_tokens": 300}
-                )
-
-        mock_agent.step = Mock(side_effect=mock_step)
-
-        game = TreasureHuntGame(str(hunt_path), mock_agent)
+        agent = StubAgent([
+            MockAgentResponse(
+                text="First",
+                tool_calls=[LS_CALL],
+                finish_reason="FUNCTION_CALL",
+                usage={"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
+            ),
+            check_treasure_response(
+                hunt_result['treasure_key'],
+                usage={"prompt_tokens": 200, "completion_tokens": 100, "total_tokens": 300}
+            ),
+        ])
+
+        game = TreasureHuntGame(str(hunt_path), agent)
         result = game.run()
 
         assert result.total_tokens == 450  # 150 + 300
         assert result.prompt_tokens == 300  # 100 + 200
         assert result.completion_tokens == 150  # 50 + 100
 
-    def test_game_tracks_time(self, temp_hunt, mock_agent):
+    def test_game_tracks_time(self, temp_hunt):
         """
         Test game tracks execution time.
 
@@ -366,27 +325,17 @@ class TestTreasureHuntGame:
         - total_time > 0
         - total_time is reasonable (< 10 seconds for mock)
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
-        mock_agent.step = Mock(return_value=MockAgentResponse(
-            text="Done",
-            tool_calls=[MockToolCall(
-                name="check_treasure",
-                arguments={"key": hunt_result['treasure_key']}
-            )],
-            finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
+        agent = StubAgent([check_treasure_response(hunt_result['treasure_key'])])
 
-        game = TreasureHuntGame(str(hunt_path), mock_agent)
+        game = TreasureHuntGame(str(hunt_path), agent)
         result = game.run()
 
         assert result.total_time > 0
         assert result.total_time < 10.0
 
-    def test_game_logs_tool_calls(self, temp_hunt, mock_agent):
+    def test_game_logs_tool_calls(self, temp_hunt):
         """
         Test game logs all tool calls.
 
@@ -395,21 +344,11 @@ class TestTreasureHuntGame:
         - Log includes name, arguments, result
         - Logs are accessible via result.tool_calls
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
-        mock_agent.step = Mock(return_value=MockAgentResponse(
-            text="Testing",
-            tool_calls=[
-                MockToolCall(name="ls", arguments={"path": "."}),
-                MockToolCall(name="pwd", arguments={})
-            ],
-            finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
+        agent = StubAgent([LS_PWD_RESP])
 
-        game = TreasureHuntGame(str(hunt_path), mock_agent, max_turns=1)
+        game = TreasureHuntGame(str(hunt_path), agent, max_turns=1)
         result = game.run()
 
         # Should have logged both tool calls
@@ -418,7 +357,7 @@ class TestTreasureHuntGame:
         assert 'ls' in logged_names
         assert 'pwd' in logged_names
 
-    def test_sequential_tool_execution(self, temp_hunt, mock_agent):
+    def test_sequential_tool_execution(self, temp_hunt):
         """
         Test tools are executed sequentially, not in parallel.
 
@@ -426,29 +365,54 @@ class TestTreasureHuntGame:
         - Multiple tool calls in one response execute in order
         - Each tool sees state changes from previous tool
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
         # Agent requests: cd subdir, then pwd
-        mock_agent.step = Mock(return_value=MockAgentResponse(
+        agent = StubAgent([MockAgentResponse(
             text="Moving",
             tool_calls=[
                 MockToolCall(name="cd", arguments={"path": hunt_result['treasure_file'].split('/')[0]}),
-                MockToolCall(name="pwd", arguments={})
+                PWD_CALL
             ],
             finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
+            usage=USAGE
+        )])
 
-        game = TreasureHuntGame(str(hunt_path), mock_agent, max_turns=1)
+        game = TreasureHuntGame(str(hunt_path), agent, max_turns=1)
         result = game.run()
 
         # pwd should reflect the cd change
         pwd_call = [tc for tc in result.tool_calls if tc['name'] == 'pwd'][0]
         assert hunt_result['treasure_file'].split('/')[0] in pwd_call['result']
 
-    def test_terminating_tool_stops_execution(self, temp_hunt, mock_agent):
+    def test_bad_tool_arguments_reported(self, temp_hunt):
+        """
+        Test tool calls with wrong argument names are reported as errors.
+
+        Properties:
+        - An unexpected argument name is not silently ignored
+        - A missing required argument is reported
+        - The error is returned as the tool result, not raised
+        """
+        hunt_path, hunt_result = temp_hunt
+
+        agent = StubAgent([MockAgentResponse(
+            text="Reading",
+            tool_calls=[
+                MockToolCall(name="ls", arguments={"path": ".", "recursive": True}),
+                MockToolCall(name="cat", arguments={"path": hunt_result['start_file']})
+            ],
+            finish_reason="FUNCTION_CALL",
+            usage=USAGE
+        )])
+
+        game = TreasureHuntGame(str(hunt_path), agent, max_turns=1)
+        result = game.run()
+
+        for logged in result.tool_calls:
+            assert logged['result'].startswith(f"Error executing {logged['name']}")
+
+    def test_terminating_tool_stops_execution(self, temp_hunt):
         """
         Test that check_treasure or give_up stops tool execution.
 
@@ -456,22 +420,20 @@ class TestTreasureHuntGame:
         - If check_treasure succeeds, remaining tools not executed
         - If give_up is called, remaining tools not executed
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
         # Agent requests: check_treasure (correct), then ls (should not execute)
-        mock_agent.step = Mock(return_value=MockAgentResponse(
+        agent = StubAgent([MockAgentResponse(
             text="Checking",
             tool_calls=[
                 MockToolCall(name="check_treasure", arguments={"key": hunt_result['treasure_key']}),
-                MockToolCall(name="ls", arguments={"path": "."})
+                LS_CALL
             ],
             finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
+            usage=USAGE
+        )])
 
-        game = TreasureHuntGame(str(hunt_path), mock_agent)
+        game = TreasureHuntGame(str(hunt_path), agent)
         result = game.run()
 
         # Should have executed check_treasure but not ls
@@ -479,7 +441,7 @@ class TestTreasureHuntGame:
         assert 'check_treasure' in tool_names
         assert 'ls' not in tool_names
 
-    def test_game_result_structure(self, temp_hunt, mock_agent):
+    def test_game_result_structure(self, temp_hunt):
         """
         Test GameResult has all required fields.
 
@@ -488,18 +450,11 @@ class TestTreasureHuntGame:
         - Types are correct
         - final_state is a GameState
         """
-        from treasure_hunt_agent.treasure_hunt_game import TreasureHuntGame
-
         hunt_path, hunt_result = temp_hunt
 
-        mock_agent.step = Mock(return_value=MockAgentResponse(
-            text="Done",
-            tool_calls=[MockToolCall(name="give_up", arguments={})],
-            finish_reason="FUNCTION_CALL",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
-        ))
+        agent = StubAgent([GIVE_UP_RESP])
 
-        game = TreasureHuntGame(str(hunt_path), mock_agent)
+        game = TreasureHuntGame(str(hunt_path), agent)
         result = game.run()
 
         assert hasattr(result, 'success')
@@ -29,31 +29,62 @@ def generate_treasure_hunt(
 """
 
 import os
-import shutil
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
+from treasure_hunt_agent.treasure_hunt_generator import (
+    _load_word_list,
+    generate_treasure_hunt,
+)
+
+
+def _walk_tree(root) -> tuple[list[str], list[str]]:
+    """Return (dirs, files) under root as relative path strings, from one os.walk."""
+    root = str(root)
+    dirs, files = [], []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        prefix = "" if rel == "." else rel + os.sep
+        dirs.extend(prefix + d for d in dirnames)
+        files.extend(prefix + f for f in filenames)
+    return dirs, files
+
+
+@pytest.fixture(scope="module")
+def generated_hunt(tmp_path_factory):
+    """
+    Generate hunts for this module, once per parameter set.
+
+    Returns get_hunt(**params) -> (hunt_path, result). Unlike hunt_cache,
+    this runs the generator on every test run, so these tests check what
+    it produces in this environment. Callers must not modify the tree.
+    """
+    hunts = {}
+
+    def get_hunt(**params):
+        key = tuple(sorted(params.items()))
+        if key not in hunts:
+            hunt_path = tmp_path_factory.mktemp("generated") / "hunt"
+            hunts[key] = hunt_path, generate_treasure_hunt(
+                base_path=str(hunt_path), **params
+            )
+        hunt_path, result = hunts[key]
+        return hunt_path, dict(result)
 
-# Will be implemented in src.treasure_hunt_generator
-# from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
+    return get_hunt
 
 
 class TestTreasureHuntGenerator:
     """Test the treasure hunt generator."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_path = tempfile.mkdtemp()
-        yield temp_path
-        # Cleanup
-        if os.path.exists(temp_path):
-            shutil.rmtree(temp_path)
-
-    def test_creates_start_file(self, temp_dir):
+    def temp_dir(self, tmp_path):
+        """Create a temporary directory for testing (pytest cleans it up)."""
+        return str(tmp_path)
+
+    def test_creates_start_file(self, generated_hunt):
         """
         Test that generator creates a start file at the root.
 
@@ -62,18 +93,16 @@ class TestTreasureHuntGenerator:
         - start file contains a relative path string
         - The path is non-empty
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
+        hunt_dir, result = generated_hunt(depth=3, seed=42)
 
-        result = generate_treasure_hunt(base_path=temp_dir, depth=3, seed=42)
-
-        start_file = Path(temp_dir) / result['start_file']
+        start_file = Path(hunt_dir) / result['start_file']
         assert start_file.exists(), f"start file {result['start_file']} should exist"
 
         content = start_file.read_text().strip()
         assert len(content) > 0, "start file should contain a clue"
         assert ".txt" in content, "start file should reference another file"
 
-    def test_creates_treasure_file(self, temp_dir):
+    def test_creates_treasure_file(self, generated_hunt):
         """
         Test that generator creates a treasure file.
 
@@ -82,19 +111,17 @@ class TestTreasureHuntGenerator:
         - treasure file contains a unique key/password
         - The key is returned in result metadata
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
-
-        result = generate_treasure_hunt(base_path=temp_dir, depth=3, seed=42)
+        hunt_dir, result = generated_hunt(depth=3, seed=42)
 
         # Find treasure file using the path from result
-        treasure_file = Path(temp_dir) / result['treasure_file']
+        treasure_file = Path(hunt_dir) / result['treasure_file']
         assert treasure_file.exists(), f"Treasure file {result['treasure_file']} should exist"
 
         treasure_content = treasure_file.read_text().strip()
         assert len(treasure_content) > 0, "treasure file should contain a key"
         assert result["treasure_key"] == treasure_content, "Key should match metadata"
 
-    def test_path_is_navigable(self, temp_dir):
+    def test_path_is_navigable(self, generated_hunt):
         """
         Test that the path from start to treasure can be followed.
 
@@ -105,33 +132,38 @@ class TestTreasureHuntGenerator:
         - No circular references
         - Path length matches metadata
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
-
-        result = generate_treasure_hunt(base_path=temp_dir, depth=4, seed=42)
-
-        current_file = Path(temp_dir) / result['start_file']
-        treasure_filename = Path(result['treasure_file']).name
+        hunt_dir, result = generated_hunt(depth=4, seed=42)
+
+        # Contents of every clue file in the hunt, read in one walk so the
+        # path is followed in memory; the tree has no symlinks, so clue
+        # paths can be followed with normpath instead of resolve()
+        contents = {}
+        for dirpath, _, names in os.walk(hunt_dir):
+            for name in names:
+                if name.endswith(".txt"):
+                    path = os.path.join(dirpath, name)
+                    with open(path, "rb") as f:
+                        contents[path] = f.read().decode("ascii", "replace").strip()
+
+        current_file = os.path.join(hunt_dir, result['start_file'])
+        treasure_filename = os.path.basename(result['treasure_file'])
         visited = set()
         steps = 0
         max_steps = 100  # Prevent infinite loops
 
-        while current_file.name != treasure_filename and steps < max_steps:
-            assert current_file.exists(), f"File should exist: {current_file}"
-            assert str(current_file) not in visited, "Circular reference detected"
-            visited.add(str(current_file))
+        while os.path.basename(current_file) != treasure_filename and steps < max_steps:
+            assert current_file in contents, f"File should exist: {current_file}"
+            assert current_file not in visited, "Circular reference detected"
+            visited.add(current_file)
 
-            clue = current_file.read_text().strip()
-            if current_file.name == treasure_filename:
-                break
+            clue = contents[current_file]
 
             # Parse relative path from clue
-            next_file = current_file.parent / clue
-            next_file = next_file.resolve()
-
-            current_file = next_file
+            current_file = os.path.normpath(os.path.join(os.path.dirname(current_file), clue))
             steps += 1
 
-        assert current_file.name == treasure_filename, f"Should end at {treasure_filename}"
+        assert os.path.basename(current_file) == treasure_filename, f"Should end at {treasure_filename}"
+        assert current_file in contents, f"Treasure file should exist: {current_file}"
         assert result["path_length"] == steps, "Path length should match metadata"
 
     def test_deterministic_with_seed(self, temp_dir):
@@ -143,24 +175,20 @@ class TestTreasureHuntGenerator:
         - Same seed creates identical file contents
         - Different seeds create different structures
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
-
         # Create two hunts with same seed
-        temp_dir2 = tempfile.mkdtemp()
-        try:
-            result1 = generate_treasure_hunt(base_path=temp_dir, depth=3, seed=42)
-            result2 = generate_treasure_hunt(base_path=temp_dir2, depth=3, seed=42)
+        hunt1 = os.path.join(temp_dir, "hunt1")
+        hunt2 = os.path.join(temp_dir, "hunt2")
+        result1 = generate_treasure_hunt(base_path=hunt1, depth=3, seed=42)
+        result2 = generate_treasure_hunt(base_path=hunt2, depth=3, seed=42)
 
-            # Get all files in both trees
-            files1 = sorted([p.relative_to(temp_dir) for p in Path(temp_dir).rglob("*") if p.is_file()])
-            files2 = sorted([p.relative_to(temp_dir2) for p in Path(temp_dir2).rglob("*") if p.is_file()])
+        # Get all files in both trees
+        files1 = sorted(_walk_tree(hunt1)[1])
+        files2 = sorted(_walk_tree(hunt2)[1])
 
-            assert files1 == files2, "Same seed should create same file structure"
-            assert result1["treasure_key"] == result2["treasure_key"], "Same seed should create same key"
-        finally:
-            shutil.rmtree(temp_dir2)
+        assert files1 == files2, "Same seed should create same file structure"
+        assert result1["treasure_key"] == result2["treasure_key"], "Same seed should create same key"
 
-    def test_respects_depth_parameter(self, temp_dir):
+    def test_respects_depth_parameter(self, generated_hunt):
         """
         Test that generator respects max depth parameter.
 
@@ -169,19 +197,20 @@ class TestTreasureHuntGenerator:
         - treasure.txt is not deeper than depth
         - Depth >= 2 (need room for start and treasure)
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
-
         max_depth = 4
-        result = generate_treasure_hunt(base_path=temp_dir, depth=max_depth, seed=42)
-
-        # Check all files
-        base = Path(temp_dir)
-        for path in base.rglob("*"):
-            relative = path.relative_to(base)
-            depth = len(relative.parts)
-            assert depth <= max_depth, f"Path {relative} exceeds max depth {max_depth}"
-
-    def test_creates_red_herrings(self, temp_dir):
+        hunt_dir, result = generated_hunt(depth=max_depth, seed=42)
+
+        # Check all files and directories; an entry's depth is the number
+        # of components in its path relative to the hunt root
+        root = str(hunt_dir).rstrip(os.sep)
+        root_len = len(root) + 1
+        for dirpath, dirnames, filenames in os.walk(root):
+            depth = 0 if dirpath == root else dirpath[root_len:].count(os.sep) + 1
+            if dirnames or filenames:
+                assert depth + 1 <= max_depth, \
+                    f"Entries in {dirpath} exceed max depth {max_depth}"
+
+    def test_creates_red_herrings(self, generated_hunt):
         """
         Test that generator creates branching paths (red herrings).
 
@@ -190,22 +219,15 @@ class TestTreasureHuntGenerator:
         - Total files > path_length (extra clue files exist)
         - num_directories > path_length
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
-
-        result = generate_treasure_hunt(
-            base_path=temp_dir,
-            depth=4,
-            branching_factor=3,
-            seed=42
-        )
+        hunt_dir, result = generated_hunt(depth=4, branching_factor=3, seed=42)
 
         # Count directories
-        num_dirs = sum(1 for p in Path(temp_dir).rglob("*") if p.is_dir())
+        num_dirs = len(_walk_tree(hunt_dir)[0])
 
         assert num_dirs >= result["path_length"], "Should have more dirs than path length"
         assert result["num_files"] > result["path_length"], "Should have extra files"
 
-    def test_all_clue_paths_are_valid(self, temp_dir):
+    def test_all_clue_paths_are_valid(self, generated_hunt):
         """
         Test that all clue files contain valid relative paths.
 
@@ -214,19 +236,20 @@ class TestTreasureHuntGenerator:
         - The path resolves to an existing file (or is a dead-end message)
         - Valid paths are relative (not absolute)
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
-
-        result = generate_treasure_hunt(base_path=temp_dir, depth=4, seed=42)
+        hunt_dir, result = generated_hunt(depth=4, seed=42)
 
         treasure_filename = Path(result['treasure_file']).name
         config_filename = '.treasure_hunt_config.json'
 
         # Check all .txt files except treasure file
-        for txt_file in Path(temp_dir).rglob("*.txt"):
-            if txt_file.name == treasure_filename or txt_file.name == config_filename:
+        for relpath in _walk_tree(hunt_dir)[1]:
+            name = os.path.basename(relpath)
+            if not name.endswith(".txt") or name in (treasure_filename, config_filename):
                 continue
 
-            clue = txt_file.read_text().strip()
+            txt_file = os.path.join(hunt_dir, relpath)
+            with open(txt_file) as f:
+                clue = f.read().strip()
 
             # Skip red herring messages
             if clue.startswith('#'):
@@ -236,9 +259,9 @@ class TestTreasureHuntGenerator:
 
             # Resolve the path - it may or may not exist (red herrings)
             # We just check that non-absolute paths can be constructed
-            target = (txt_file.parent / clue).resolve()
+            target = os.path.normpath(os.path.join(os.path.dirname(txt_file), clue))
 
-    def test_returns_metadata(self, temp_dir):
+    def test_returns_metadata(self, generated_hunt):
         """
         Test that function returns proper metadata.
 
@@ -249,9 +272,7 @@ class TestTreasureHuntGenerator:
         - Numeric values are positive integers
         - path_length >= 1
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
-
-        result = generate_treasure_hunt(base_path=temp_dir, depth=4, seed=42)
+        hunt_dir, result = generated_hunt(depth=4, seed=42)
 
         assert isinstance(result, dict), "Should return dict"
         assert "treasure_key" in result
@@ -282,23 +303,43 @@ class TestTreasureHuntGenerator:
         - 'hard' creates complex hunts (more branches, more depth)
         - Difficulty affects final statistics
         """
-        from treasure_hunt_agent.treasure_hunt_generator import generate_treasure_hunt
-
-        temp_dir2 = tempfile.mkdtemp()
-        try:
-            result_easy = generate_treasure_hunt(
-                base_path=temp_dir,
-                difficulty='easy',
-                seed=42
-            )
-            result_hard = generate_treasure_hunt(
-                base_path=temp_dir2,
-                difficulty='hard',
-                seed=42
-            )
+        result_easy = generate_treasure_hunt(
+            base_path=os.path.join(temp_dir, "easy"),
+            difficulty='easy',
+            seed=42
+        )
+        result_hard = generate_treasure_hunt(
+            base_path=os.path.join(temp_dir, "hard"),
+            difficulty='hard',
+            seed=42
+        )
 
-            # Hard should be more complex
-            assert result_hard["num_directories"] >= result_easy["num_directories"], \
-                "Hard difficulty should have more directories"
-        finally:
-            shutil.rmtree(temp_dir2)
+        # Hard should be more complex
+        assert result_hard["num_directories"] >= result_easy["num_directories"], \
+            "Hard difficulty should have more directories"
+
+    def test_word_list_cache(self, temp_dir):
+        """
+        Test that the filtered word list is cached between loads.
+
+        Properties:
+        - Words are lowercased and filtered to 3-12 alphabetic characters
+        - A second load is served from the cache file
+        - Changing the source word list invalidates the cache
+        """
+        words_path = os.path.join(temp_dir, 'words')
+        cache_path = os.path.join(temp_dir, 'cache', 'words.pkl')
+        Path(words_path).write_text("Apple\nab\nit's\nbanana\n\nextraordinarily\n")
+
+        words = _load_word_list((words_path,), cache_path)
+        assert words == ['apple', 'banana']
+        assert os.path.exists(cache_path)
+
+        with patch(
+            'treasure_hunt_agent.treasure_hunt_generator._read_word_file'
+        ) as mock_read:
+            assert _load_word_list((words_path,), cache_path) == words
+            mock_read.assert_not_called()
+
+        Path(words_path).write_text("Apple\ncherry\ndate\n")
+        assert _load_word_list((words_path,), cache_path) == ['apple', 'cherry', 'date']